@@ -18,13 +18,13 @@ try:
     puts = chain.puts[chain.puts['lastPrice'] * 100 <= 43]
 
     print(f"Expiration: {exp}")
-    print(f"\nCALLS under $43: {len(calls)}")
-    for _, row in calls.head(5).iterrows():
-        print(f"  ${row['strike']:.1f} strike = ${row['lastPrice']*100:.2f}/contract")
-
-    print(f"\nPUTS under $43: {len(puts)}")
-    for _, row in puts.head(5).iterrows():
-        print(f"  ${row['strike']:.1f} strike = ${row['lastPrice']*100:.2f}/contract")
+    lines = [f"\nCALLS under $43: {len(calls)}"]
+    lines += [f"  ${row.strike:.1f} strike = ${row.lastPrice*100:.2f}/contract"
+              for row in calls.head(5).itertuples(index=False)]
+    lines.append(f"\nPUTS under $43: {len(puts)}")
+    lines += [f"  ${row.strike:.1f} strike = ${row.lastPrice*100:.2f}/contract"
+              for row in puts.head(5).itertuples(index=False)]
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 except requests.exceptions.JSONDecodeError as e:
     print(f"Error decoding JSON from yfinance: {e}")
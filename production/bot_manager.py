@@ -10,6 +10,15 @@ import signal
 import subprocess
 from pathlib import Path
 
+
+def _silent_unlink(path):
+    """Remove a file, ignoring it if already gone"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
 class BotManager:
     def __init__(self):
         self.bot_script = "src/main_bot.py"
@@ -18,29 +27,27 @@ class BotManager:
         
     def is_bot_running(self):
         """Check if bot is currently running"""
-        if not os.path.exists(self.pid_file):
-            return False
-            
         try:
             with open(self.pid_file, 'r') as f:
                 pid = int(f.read().strip())
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError):
+            _silent_unlink(self.pid_file)
+            return False
             
+        try:
             # Check if process exists
             os.kill(pid, 0)  # Sends no signal, just checks if process exists
             return True
             
-        except (OSError, ValueError, ProcessLookupError):
+        except (OSError, ProcessLookupError):
             # PID file exists but process is dead - clean up
-            if os.path.exists(self.pid_file):
-                os.remove(self.pid_file)
+            _silent_unlink(self.pid_file)
             return False
     
     def stop_bot(self):
         """Safely stop the bot"""
-        if not os.path.exists(self.pid_file):
-            print("No PID file found - checking for running processes...")
-            return self.force_stop_all()
-        
         try:
             with open(self.pid_file, 'r') as f:
                 pid = int(f.read().strip())
@@ -63,12 +70,14 @@ class BotManager:
                 os.kill(pid, signal.SIGKILL)
             
             # Clean up PID file
-            if os.path.exists(self.pid_file):
-                os.remove(self.pid_file)
+            _silent_unlink(self.pid_file)
             
             print("✅ Bot stopped successfully")
             return True
             
+        except FileNotFoundError:
+            print("No PID file found - checking for running processes...")
+            return self.force_stop_all()
         except Exception as e:
             print(f"❌ Error stopping bot: {e}")
             return self.force_stop_all()
@@ -107,8 +116,7 @@ class BotManager:
                         os.kill(int(pid), signal.SIGKILL)
             
             # Clean up PID file
-            if os.path.exists(self.pid_file):
-                os.remove(self.pid_file)
+            _silent_unlink(self.pid_file)
             
             return True
             
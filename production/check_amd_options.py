@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import sys
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
@@ -26,26 +27,25 @@ try:
             print('Affordable CALLS (within $43):')
             affordable = near_money[near_money['lastPrice'] <= 4.30]  # $4.30 max per contract
             if not affordable.empty:
-                for _, row in affordable.head(5).iterrows():
-                    cost = row['lastPrice'] * 100  # Contract cost
-                    profit_breakeven = row['strike'] + row['lastPrice']
-                    print(f'  Strike ${row["strike"]:.0f} - Premium: ${row["lastPrice"]:.2f} (${cost:.0f} total) - Breakeven: ${profit_breakeven:.2f}')
+                # Contract cost is premium * 100; breakeven is strike + premium
+                lines = [f'  Strike ${row.strike:.0f} - Premium: ${row.lastPrice:.2f} (${row.lastPrice * 100:.0f} total) - Breakeven: ${row.strike + row.lastPrice:.2f}'
+                         for row in affordable.head(5).itertuples(index=False)]
+                sys.stdout.write('\n'.join(lines) + '\n')
             else:
                 print('  No calls under $4.30 premium')
                 print('  Cheapest calls:')
-                for _, row in near_money.head(3).iterrows():
-                    cost = row['lastPrice'] * 100
-                    print(f'    Strike ${row["strike"]:.0f} - Premium: ${row["lastPrice"]:.2f} (${cost:.0f} total)')
+                lines = [f'    Strike ${row.strike:.0f} - Premium: ${row.lastPrice:.2f} (${row.lastPrice * 100:.0f} total)'
+                         for row in near_money.head(3).itertuples(index=False)]
+                sys.stdout.write('\n'.join(lines) + '\n')
         
         # Also check some cheaper out-of-money options
         print('\nCheaper out-of-money calls:')
         otm_calls = calls[calls['strike'] > price + 5]  # $5+ out of money
         cheap_otm = otm_calls[otm_calls['lastPrice'] <= 1.00]  # Under $1 premium
         if not cheap_otm.empty:
-            for _, row in cheap_otm.head(3).iterrows():
-                cost = row['lastPrice'] * 100
-                profit_breakeven = row['strike'] + row['lastPrice']
-                print(f'  Strike ${row["strike"]:.0f} - Premium: ${row["lastPrice"]:.2f} (${cost:.0f} total) - Breakeven: ${profit_breakeven:.2f}')
+            lines = [f'  Strike ${row.strike:.0f} - Premium: ${row.lastPrice:.2f} (${row.lastPrice * 100:.0f} total) - Breakeven: ${row.strike + row.lastPrice:.2f}'
+                     for row in cheap_otm.head(3).itertuples(index=False)]
+            sys.stdout.write('\n'.join(lines) + '\n')
 
 except Exception as e:
     print(f"Error getting options data: {e}")
\ No newline at end of file
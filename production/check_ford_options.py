@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import sys
 import yfinance as yf
 import pandas as pd
 from datetime import datetime
@@ -40,35 +41,33 @@ try:
                     print('CALLS within $43 budget:')
                     affordable = near_money[near_money['lastPrice'] <= 4.30]  # Max $430 per contract
                     if not affordable.empty:
-                        for _, row in affordable.head(5).iterrows():
-                            cost = row['lastPrice'] * 100  # Contract cost
-                            profit_breakeven = row['strike'] + row['lastPrice']
-                            print(f'  ${row["strike"]:.0f} strike - Premium: ${row["lastPrice"]:.2f} (${cost:.0f} total) - Breakeven: ${profit_breakeven:.2f}')
+                        # Contract cost is premium * 100; breakeven is strike + premium
+                        lines = [f'  ${row.strike:.0f} strike - Premium: ${row.lastPrice:.2f} (${row.lastPrice * 100:.0f} total) - Breakeven: ${row.strike + row.lastPrice:.2f}'
+                                 for row in affordable.head(5).itertuples(index=False)]
+                        sys.stdout.write('\n'.join(lines) + '\n')
                     else:
                         print('  Checking cheapest near-money calls:')
-                        for _, row in near_money.head(3).iterrows():
-                            cost = row['lastPrice'] * 100
-                            print(f'    ${row["strike"]:.0f} strike - Premium: ${row["lastPrice"]:.2f} (${cost:.0f} total)')
+                        lines = [f'    ${row.strike:.0f} strike - Premium: ${row.lastPrice:.2f} (${row.lastPrice * 100:.0f} total)'
+                                 for row in near_money.head(3).itertuples(index=False)]
+                        sys.stdout.write('\n'.join(lines) + '\n')
                 
                 # Out of money calls (cheaper)
                 otm_calls = calls[calls['strike'] > price]
                 cheap_otm = otm_calls[otm_calls['lastPrice'] <= 0.50]  # Under $0.50 premium
                 if not cheap_otm.empty:
-                    print('\nCheap out-of-money CALLS:')
-                    for _, row in cheap_otm.head(5).iterrows():
-                        cost = row['lastPrice'] * 100
-                        profit_breakeven = row['strike'] + row['lastPrice']
-                        print(f'  ${row["strike"]:.0f} strike - Premium: ${row["lastPrice"]:.2f} (${cost:.0f} total) - Breakeven: ${profit_breakeven:.2f}')
+                    lines = ['\nCheap out-of-money CALLS:']
+                    lines += [f'  ${row.strike:.0f} strike - Premium: ${row.lastPrice:.2f} (${row.lastPrice * 100:.0f} total) - Breakeven: ${row.strike + row.lastPrice:.2f}'
+                              for row in cheap_otm.head(5).itertuples(index=False)]
+                    sys.stdout.write('\n'.join(lines) + '\n')
                 
                 # Also check puts for comparison
                 puts = options.puts
                 cheap_puts = puts[(puts['strike'] <= price + 1) & (puts['lastPrice'] <= 0.50)]
                 if not cheap_puts.empty:
-                    print('\nCheap PUTS (bearish bets):')
-                    for _, row in cheap_puts.head(3).iterrows():
-                        cost = row['lastPrice'] * 100
-                        profit_breakeven = row['strike'] - row['lastPrice']
-                        print(f'  ${row["strike"]:.0f} strike - Premium: ${row["lastPrice"]:.2f} (${cost:.0f} total) - Breakeven: ${profit_breakeven:.2f}')
+                    lines = ['\nCheap PUTS (bearish bets):']
+                    lines += [f'  ${row.strike:.0f} strike - Premium: ${row.lastPrice:.2f} (${row.lastPrice * 100:.0f} total) - Breakeven: ${row.strike - row.lastPrice:.2f}'
+                              for row in cheap_puts.head(3).itertuples(index=False)]
+                    sys.stdout.write('\n'.join(lines) + '\n')
                         
             except Exception as e:
                 print(f'  Error getting options for {exp}: {e}')
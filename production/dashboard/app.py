@@ -51,7 +51,10 @@ def load_bot_status() -> Dict[str, Any]:
     try:
         status_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'bot_status.json')
         
-        if not os.path.exists(status_file):
+        try:
+            with open(status_file, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
             return {
                 'status': {
                     'enabled': False,
@@ -70,9 +73,6 @@ def load_bot_status() -> Dict[str, Any]:
                 },
                 'timestamp': datetime.now().isoformat()
             }
-        
-        with open(status_file, 'r') as f:
-            data = json.load(f)
             
         # Check if data is recent (within last 2 minutes)
         if 'timestamp' in data:
@@ -13,19 +13,61 @@ try:
     from alpaca.trading.requests import MarketOrderRequest, LimitOrderRequest
     from alpaca.trading.enums import OrderSide as AlpacaOrderSide, TimeInForce as AlpacaTimeInForce
     NEW_ALPACA = True
+    _TF_MAP = {'1Day': TimeFrame.Day, '1Hour': TimeFrame.Hour, '1Min': TimeFrame.Minute}
 except ImportError:
     # Fallback to old library
     import alpaca_trade_api as tradeapi
     NEW_ALPACA = False
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import asyncio
+import functools
+import json
+import os
+import hashlib
+import random
+import threading
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import pytz
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 import logging
 from enum import Enum
 import time
 
+# orjson parses REST payloads several times faster than the stdlib when available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _backoff_delay(attempt: int, cap: float = 30.0) -> float:
+    """Exponential backoff with jitter (2s, 4s, 8s... plus up to 1s) so workers don't retry in lockstep"""
+    return min(cap, 2 ** (attempt + 1) + random.uniform(0, 1.0))
+
+# Alpaca's market calendar times are US/Eastern
+_ET_TZ = pytz.timezone('US/Eastern')
+
+# Crypto base currencies, extended at client start-up with Alpaca's crypto
+# asset list. Used to recognise slash-less pairs like 'SOLUSD'.
+_CRYPTO_BASES = {'AAVE', 'AVAX', 'BAT', 'BCH', 'BTC', 'CRV', 'DOGE', 'DOT', 'ETH', 'GRT',
+                 'LINK', 'LTC', 'MKR', 'PEPE', 'SHIB', 'SOL', 'SUSHI', 'UNI', 'USDC',
+                 'USDT', 'XRP', 'XTZ', 'YFI'}
+_CRYPTO_QUOTES = ('USDT', 'USDC', 'USD', 'BTC', 'ETH')
+
 class OrderSide(Enum):
     BUY = "buy"
     SELL = "sell"
@@ -42,7 +84,7 @@ class TimeInForce(Enum):
     IOC = "ioc"  # Immediate Or Cancel
     FOK = "fok"  # Fill Or Kill
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Portfolio position data"""
     symbol: str
@@ -54,7 +96,7 @@ class Position:
     unrealized_plpc: float
     avg_entry_price: float
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order data"""
     id: str
@@ -68,7 +110,7 @@ class Order:
     created_at: datetime
     updated_at: datetime
 
-@dataclass
+@dataclass(slots=True)
 class AccountInfo:
     """Account information"""
     buying_power: float
@@ -80,6 +122,26 @@ class AccountInfo:
     day_trading_buying_power: float
     status: str
 
+# Row layout for bar conversion; declaring it up front skips pandas' dtype
+# inference and block consolidation. Timestamps stay out of the record because
+# datetime64 can't hold a timezone - they become the DatetimeIndex instead.
+_BAR_DTYPE = np.dtype([('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'), ('volume', 'f8')])
+_BAR_DTYPE_INT_VOLUME = np.dtype([('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'), ('volume', 'i8')])
+
+def _bars_to_frame(timestamps, rows, count: int, dtype: np.dtype = _BAR_DTYPE) -> pd.DataFrame:
+    """Build an OHLCV DataFrame from (open, high, low, close, volume) tuples in one contiguous buffer"""
+    records = np.fromiter(rows, dtype=dtype, count=count)
+    return pd.DataFrame.from_records(records, index=pd.DatetimeIndex(timestamps, name='timestamp'))
+
+# DataFrame column layouts matching the Position/Order dataclass fields
+POSITION_COLUMNS = ['symbol', 'qty', 'side', 'market_value', 'cost_basis',
+                    'unrealized_pl', 'unrealized_plpc', 'avg_entry_price']
+_POSITION_NUMERIC = ['qty', 'market_value', 'cost_basis', 'unrealized_pl',
+                     'unrealized_plpc', 'avg_entry_price']
+ORDER_COLUMNS = ['id', 'symbol', 'qty', 'side', 'order_type', 'status',
+                 'filled_qty', 'filled_avg_price', 'created_at', 'updated_at']
+_ORDER_NUMERIC = ['qty', 'filled_qty', 'filled_avg_price']
+
 class AlpacaClient:
     """Alpaca API client for trading operations"""
     
@@ -89,6 +151,17 @@ class AlpacaClient:
         
         # Get API credentials
         credentials = config_manager.get_api_credentials()
+        self._credentials = credentials
+        self._trade_stream = None
+        
+        # Direct REST access to the market data API (used by the async bulk fetchers)
+        self.data_url = config_manager.config.get('apis', {}).get('alpaca', {}).get(
+            'data_url', 'https://data.alpaca.markets'
+        ).rstrip('/')
+        self._data_headers = {
+            'APCA-API-KEY-ID': credentials['ALPACA_API_KEY'],
+            'APCA-API-SECRET-KEY': credentials['ALPACA_SECRET_KEY']
+        }
         
         # Initialize Alpaca API with library detection
         try:
@@ -104,6 +177,10 @@ class AlpacaClient:
                     credentials['ALPACA_API_KEY'],
                     credentials['ALPACA_SECRET_KEY']
                 )
+                # alpaca-py already retries 429/504 itself; stacking transport retries
+                # under that loop would multiply attempts (and sleeps) per call
+                for client in (self.trading_client, self.crypto_data_client, self.stock_data_client):
+                    self._configure_rest_session(client, transport_retries=False)
                 
                 # Test connection
                 account = self.trading_client.get_account()
@@ -117,6 +194,7 @@ class AlpacaClient:
                     'https://api.alpaca.markets',
                     api_version='v2'
                 )
+                self._configure_rest_session(self.api)
                 
                 # Test connection
                 account = self.api.get_account()
@@ -125,9 +203,188 @@ class AlpacaClient:
         except Exception as e:
             self.logger.error(f"Failed to initialize Alpaca API: {e}")
             raise
+        
+        self._init_response_cache()
+        self._load_crypto_bases()
+        
+        # (ET date, (open_dt, close_dt)) of the trading session last looked up;
+        # (None, None) means no session that day
+        self._session_cache = None
+        
+        # alpaca-py returns enums (side/order_type may be None), the old library plain strings
+        self._enum_str = (lambda e: str(e) if e is None else e.value) if NEW_ALPACA else str
+    
+    @staticmethod
+    def _configure_rest_session(api, transport_retries: bool = True):
+        """Give a REST client (either library) a pooled keep-alive session, optionally with transport-level retries"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = getattr(api, '_session', None) or requests.Session()
+        # urllib3's default allowed_methods excludes POST, so orders are never resubmitted.
+        # raise_on_status=False hands the last response back so the client's own
+        # HTTP error handling still applies once retries run out.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.5, raise_on_status=False,
+                              status_forcelist=[429, 500, 502, 503, 504]) if transport_retries else 0
+        )
+        session.mount('https://', adapter)
+        api._session = session
+    
+    # Cache TTLs (seconds), matched to how quickly each value actually changes
+    ACCOUNT_TTL = 2.0
+    POSITIONS_TTL = 1.0
+    CLOCK_TTL = 30.0
+    QUOTE_TTL = 0.25
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _is_crypto(symbol: str) -> bool:
+        """Whether a symbol is a crypto pair ('SOL/USD' or 'SOLUSD'), memoized per symbol"""
+        if '/' in symbol:
+            return True
+        for quote in _CRYPTO_QUOTES:
+            if symbol.endswith(quote) and symbol[:-len(quote)] in _CRYPTO_BASES:
+                return True
+        return False
+    
+    @staticmethod
+    def _crypto_pair(symbol: str) -> str:
+        """'SOLUSD' -> 'SOL/USD'; symbols that already have a slash are returned unchanged"""
+        if '/' in symbol:
+            return symbol
+        for quote in _CRYPTO_QUOTES:
+            if symbol.endswith(quote) and symbol[:-len(quote)] in _CRYPTO_BASES:
+                return f"{symbol[:-len(quote)]}/{quote}"
+        return symbol
+    
+    def _load_crypto_bases(self):
+        """Add Alpaca's tradable crypto base currencies to the classifier (best effort)"""
+        try:
+            if NEW_ALPACA:
+                from alpaca.trading.requests import GetAssetsRequest
+                from alpaca.trading.enums import AssetClass
+                assets = self.trading_client.get_all_assets(GetAssetsRequest(asset_class=AssetClass.CRYPTO))
+            else:
+                assets = self.api.list_assets(asset_class='crypto')
+            
+            _CRYPTO_BASES.update(asset.symbol.split('/')[0] for asset in assets)
+            AlpacaClient._is_crypto.cache_clear()
+            
+        except Exception as e:
+            self.logger.warning(f"Could not load crypto asset list, using built-in list: {e}")
+    
+    def _init_response_cache(self):
+        """Set up the short-TTL response cache (Redis when REDIS_URL is set, else in-process)"""
+        self.redis = None
+        self._local_cache = {}
+        
+        # Scope keys to the API key so bots with different accounts never share entries
+        key_id = self._credentials.get('ALPACA_API_KEY') or ''
+        self._cache_prefix = 'rsi-bot:' + hashlib.blake2b(key_id.encode(), digest_size=8).hexdigest() + ':'
+        
+        redis_url = os.getenv('REDIS_URL')
+        if redis is None or not redis_url:
+            return
+        
+        try:
+            client = redis.Redis.from_url(redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+            client.ping()
+            self.redis = client
+            self.logger.info("Caching Alpaca responses in Redis")
+        except Exception as e:
+            self.logger.info(f"Redis unavailable ({e}), caching Alpaca responses in-process")
+    
+    @staticmethod
+    def _encode_cached(result) -> bytes:
+        """Serialize a cacheable response (AccountInfo, DataFrame or JSON value) to JSON bytes"""
+        if isinstance(result, AccountInfo):
+            payload = {'t': 'account', 'v': {f.name: getattr(result, f.name) for f in fields(AccountInfo)}}
+        elif isinstance(result, pd.DataFrame):
+            payload = {'t': 'frame', 'columns': list(result.columns),
+                       'dtypes': [str(dt) for dt in result.dtypes],
+                       'data': result.to_numpy(dtype=object).tolist()}
+        else:
+            payload = {'t': 'value', 'v': result}
+        
+        def default(obj):
+            if isinstance(obj, datetime):
+                return obj.isoformat()
+            if isinstance(obj, Enum):
+                return obj.value
+            if isinstance(obj, np.generic):
+                return obj.item()
+            return str(obj)
+        
+        if orjson is not None:
+            return orjson.dumps(payload, default=default, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(payload, default=default).encode('utf-8')
+    
+    @staticmethod
+    def _decode_cached(data: bytes):
+        """Inverse of _encode_cached"""
+        payload = _json_loads(data)
+        kind = payload['t']
+        if kind == 'account':
+            return AccountInfo(**payload['v'])
+        if kind == 'frame':
+            df = pd.DataFrame(payload['data'], columns=payload['columns'])
+            return df.astype({col: dt for col, dt in zip(payload['columns'], payload['dtypes'])
+                              if dt != 'object'})
+        value = payload['v']
+        if isinstance(value, dict) and isinstance(value.get('timestamp'), str):
+            value['timestamp'] = datetime.fromisoformat(value['timestamp'])
+        return value
+    
+    def _cached(self, key: str, ttl: float, fn):
+        """Return fn()'s result, reusing it for ttl seconds. None results are not cached."""
+        key = self._cache_prefix + key
+        if self.redis is not None:
+            try:
+                cached = self.redis.get(key)
+                if cached is not None:
+                    return self._decode_cached(cached)
+            except Exception as e:
+                self.logger.debug(f"Redis read failed for {key}: {e}")
+        else:
+            entry = self._local_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+        
+        result = fn()
+        if result is None:
+            return None
+        
+        if self.redis is not None:
+            try:
+                # PSETEX sets value and millisecond TTL atomically
+                self.redis.psetex(key, max(1, int(ttl * 1000)), self._encode_cached(result))
+            except Exception as e:
+                self.logger.debug(f"Redis write failed for {key}: {e}")
+        else:
+            self._local_cache[key] = (time.monotonic() + ttl, result)
+        
+        return result
+    
+    def _invalidate(self, *keys: str):
+        """Drop cached responses that an order may have changed"""
+        keys = tuple(self._cache_prefix + key for key in keys)
+        if self.redis is not None:
+            try:
+                self.redis.delete(*keys)
+            except Exception as e:
+                self.logger.debug(f"Redis delete failed for {keys}: {e}")
+        for key in keys:
+            self._local_cache.pop(key, None)
     
     def get_account(self) -> AccountInfo:
         """Get current account information"""
+        return self._cached('alpaca:acct', self.ACCOUNT_TTL, self._fetch_account)
+    
+    def _fetch_account(self) -> AccountInfo:
         try:
             if NEW_ALPACA:
                 account = self.trading_client.get_account()
@@ -151,33 +408,49 @@ class AlpacaClient:
     
     def get_positions(self) -> List[Position]:
         """Get all current positions"""
+        return self.frame_to_positions(self.get_positions_frame())
+    
+    def get_positions_for(self, symbols: Iterable[str]) -> List[Position]:
+        """Get current positions for the given symbols only"""
+        df = self.get_positions_frame()
+        return self.frame_to_positions(df[df['symbol'].isin(list(symbols))])
+    
+    def get_positions_frame(self) -> pd.DataFrame:
+        """Get all current positions as a DataFrame (one row per position, Position field columns)"""
+        df = self._cached('alpaca:pos', self.POSITIONS_TTL, self._fetch_positions)
+        return df if df is not None else pd.DataFrame(columns=POSITION_COLUMNS)
+    
+    @staticmethod
+    def frame_to_positions(df: pd.DataFrame) -> List[Position]:
+        """Convert a get_positions_frame() result back to Position objects"""
+        return [Position(*row) for row in df[POSITION_COLUMNS].itertuples(index=False, name=None)]
+    
+    def _fetch_positions(self) -> Optional[pd.DataFrame]:
         try:
             if NEW_ALPACA:
                 positions = self.trading_client.get_all_positions()
             else:
                 positions = self.api.list_positions()
             
-            result = []
-            for pos in positions:
-                result.append(Position(
-                    symbol=pos.symbol,
-                    qty=float(pos.qty),
-                    side=pos.side,
-                    market_value=float(pos.market_value),
-                    cost_basis=float(pos.cost_basis),
-                    unrealized_pl=float(pos.unrealized_pl),
-                    unrealized_plpc=float(pos.unrealized_plpc),
-                    avg_entry_price=float(pos.avg_entry_price)
-                ))
-            
-            return result
+            rows = [(pos.symbol, pos.qty, pos.side, pos.market_value, pos.cost_basis,
+                     pos.unrealized_pl, pos.unrealized_plpc, pos.avg_entry_price)
+                    for pos in positions]
+            df = pd.DataFrame.from_records(rows, columns=POSITION_COLUMNS)
+            # One cast per column instead of a float() call per field per row
+            df[_POSITION_NUMERIC] = df[_POSITION_NUMERIC].astype('float64')
+            return df
             
         except Exception as e:
             self.logger.error(f"Failed to get positions: {e}")
-            return []
+            return None
     
     def get_orders(self, status: str = "all", limit: int = 100) -> List[Order]:
         """Get orders with optional status filter"""
+        df = self.get_orders_frame(status, limit)
+        return [Order(*row) for row in df[ORDER_COLUMNS].itertuples(index=False, name=None)]
+    
+    def get_orders_frame(self, status: str = "all", limit: int = 100) -> pd.DataFrame:
+        """Get orders as a DataFrame (one row per order, Order field columns)"""
         try:
             if NEW_ALPACA:
                 from alpaca.trading.enums import QueryOrderStatus
@@ -195,51 +468,51 @@ class AlpacaClient:
             else:
                 orders = self.api.list_orders(status=status, limit=limit)
             
-            result = []
-            for order in orders:
-                result.append(Order(
-                    id=str(order.id),
-                    symbol=order.symbol,
-                    qty=float(order.qty),
-                    side=order.side.value if hasattr(order.side, 'value') else str(order.side),
-                    order_type=order.order_type.value if hasattr(order.order_type, 'value') else str(order.order_type),
-                    status=order.status.value if hasattr(order.status, 'value') else str(order.status),
-                    filled_qty=float(order.filled_qty or 0),
-                    filled_avg_price=float(order.filled_avg_price or 0) if order.filled_avg_price else 0.0,
-                    created_at=order.created_at,
-                    updated_at=order.updated_at
-                ))
+            rows = [(
+                str(order.id),
+                order.symbol,
+                None,
+                self._enum_str(order.side),
+                self._enum_str(order.order_type),
+                self._enum_str(order.status),
+                None,
+                None,
+                order.created_at,
+                order.updated_at
+            ) for order in orders]
             
-            return result
+            # Numeric fields go straight into one float64 array (None -> NaN) rather
+            # than through object columns; unfilled orders report 0 filled
+            numeric = np.array([(order.qty, order.filled_qty, order.filled_avg_price) for order in orders],
+                               dtype=np.float64).reshape(-1, len(_ORDER_NUMERIC))
+            numeric[:, 1:] = np.nan_to_num(numeric[:, 1:])
+            
+            df = pd.DataFrame.from_records(rows, columns=ORDER_COLUMNS)
+            df[_ORDER_NUMERIC] = numeric
+            return df
             
         except Exception as e:
             self.logger.error(f"Failed to get orders: {e}")
-            return []
+            return pd.DataFrame(columns=ORDER_COLUMNS)
     
     def get_bars_new(self, symbol: str, timeframe: str = '1Day', limit: int = 100, retry_count: int = 3) -> Optional[pd.DataFrame]:
         """Get historical bars using new alpaca-py library with retry logic"""
+        tf = _TF_MAP.get(timeframe, TimeFrame.Day)
+        is_crypto = self._is_crypto(symbol)
+        
+        # Calculate date range once so retries request the same window
+        # - use date objects only (no time) for Alpaca API
+        now = datetime.now()
+        end_date = now.date()
+        start_date = (now - timedelta(days=min(limit * 2, 365))).date()
+        
         for attempt in range(retry_count):
             try:
-                # Convert timeframe
-                if timeframe == '1Day':
-                    tf = TimeFrame.Day
-                elif timeframe == '1Hour':
-                    tf = TimeFrame.Hour
-                elif timeframe == '1Min':
-                    tf = TimeFrame.Minute
-                else:
-                    tf = TimeFrame.Day
-                
-                is_crypto = '/' in symbol or symbol.endswith('USD')
-                
-                # Calculate date range - use date objects only (no time) for Alpaca API
-                end_date = datetime.now().date()
-                start_date = (datetime.now() - timedelta(days=min(limit * 2, 365))).date()
-                
                 if attempt == 0:
-                    self.logger.info(f"New API: Requesting {symbol} ({'crypto' if is_crypto else 'stock'}) from {start_date} to {end_date}")
+                    self.logger.info("New API: Requesting %s (%s) from %s to %s",
+                                     symbol, 'crypto' if is_crypto else 'stock', start_date, end_date)
                 else:
-                    self.logger.info(f"Retry attempt {attempt + 1}/{retry_count} for {symbol}")
+                    self.logger.info("Retry attempt %d/%d for %s", attempt + 1, retry_count, symbol)
                 
                 if is_crypto:
                     request = CryptoBarsRequest(
@@ -261,38 +534,33 @@ class AlpacaClient:
                     bars = bars_response[symbol]
                 
                 if not bars or len(bars) == 0:
-                    self.logger.warning(f"No bars returned from new API for {symbol}")
+                    self.logger.warning("No bars returned from new API for %s", symbol)
                     return None
                 
                 # Convert to DataFrame
-                data = []
-                for bar in bars:
-                    data.append({
-                        'timestamp': bar.timestamp,
-                        'open': float(bar.open),
-                        'high': float(bar.high),
-                        'low': float(bar.low),
-                        'close': float(bar.close),
-                        'volume': float(bar.volume) if bar.volume else 0
-                    })
-                
-                df = pd.DataFrame(data)
-                df.set_index('timestamp', inplace=True)
-                df = df.tail(limit)  # Get only the requested amount
+                df = _bars_to_frame(
+                    [bar.timestamp for bar in bars],
+                    ((bar.open, bar.high, bar.low, bar.close, bar.volume or 0) for bar in bars),
+                    len(bars)
+                )
+                # Get only the requested amount. The window is left-anchored, so a
+                # server-side limit would return the oldest bars rather than the newest.
+                df = df.iloc[-limit:]
                 
-                self.logger.info(f"New API: Retrieved {len(df)} bars for {symbol}")
+                self.logger.info("New API: Retrieved %d bars for %s", len(df), symbol)
                 return df
                 
             except (ConnectionResetError, ConnectionError, ConnectionAbortedError) as e:
                 if attempt < retry_count - 1:
-                    wait_time = (attempt + 1) * 2  # Exponential backoff: 2s, 4s, 6s
-                    self.logger.warning(f"Connection error for {symbol} (attempt {attempt + 1}): {e}. Retrying in {wait_time}s...")
+                    wait_time = _backoff_delay(attempt)
+                    self.logger.warning("Connection error for %s (attempt %d): %s. Retrying in %ss...",
+                                        symbol, attempt + 1, e, round(wait_time, 1))
                     time.sleep(wait_time)
                 else:
-                    self.logger.error(f"New API failed for {symbol} after {retry_count} attempts: {e}")
+                    self.logger.error("New API failed for %s after %d attempts: %s", symbol, retry_count, e)
                     return None
             except Exception as e:
-                self.logger.error(f"New API failed for {symbol}: {e}")
+                self.logger.error("New API failed for %s: %s", symbol, e)
                 return None
         
         return None
@@ -304,7 +572,7 @@ class AlpacaClient:
             result = self.get_bars_new(symbol, timeframe, limit)
             if result is not None:
                 return result
-            self.logger.info(f"New API failed for {symbol}, trying fallback...")
+            self.logger.info("New API failed for %s, trying fallback...", symbol)
         
         # Fallback to old API or yfinance
         try:
@@ -319,16 +587,17 @@ class AlpacaClient:
                 tf = tradeapi.rest.TimeFrame.Day
             
             # Check if this is a crypto symbol
-            is_crypto = '/' in symbol
+            is_crypto = self._is_crypto(symbol)
             
             # For crypto, ensure we have proper date range with correct format
             if not start and not end:
                 end = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
                 start = end - timedelta(days=200)  # Get more data for crypto
             
-            self.logger.info(f"Requesting {symbol} data: crypto={is_crypto}, timeframe={timeframe}, limit={limit}")
-            if start and end:
-                self.logger.info(f"Date range: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}")
+            self.logger.info("Requesting %s data: crypto=%s, timeframe=%s, limit=%d",
+                             symbol, is_crypto, timeframe, limit)
+            if start and end and self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Date range: %s to %s", start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
             
             # Get bars - use crypto endpoint if needed
             try:
@@ -338,7 +607,7 @@ class AlpacaClient:
                 else:
                     bars = self.api.get_bars(symbol, tf, start=start, end=end, limit=limit)
             except Exception as api_error:
-                self.logger.warning(f"Primary API call failed for {symbol}: {api_error}")
+                self.logger.warning("Primary API call failed for %s: %s", symbol, api_error)
                 # Fallback: try different approach
                 if is_crypto:
                     try:
@@ -346,39 +615,31 @@ class AlpacaClient:
                         bars = self.api.get_crypto_bars(symbol, tf, start=start, end=end)
                     except Exception:
                         # Final fallback: try stock API for crypto (some work)
-                        self.logger.info(f"Trying stock API for crypto symbol {symbol}")
+                        self.logger.info("Trying stock API for crypto symbol %s", symbol)
                         bars = self.api.get_bars(symbol, tf, start=start, end=end, limit=limit)
                 else:
                     raise api_error
             
             if not bars or len(bars) == 0:
-                self.logger.warning(f"No bars returned for {symbol}")
+                self.logger.warning("No bars returned for %s", symbol)
                 return None
             
-            self.logger.info(f"Retrieved {len(bars)} bars for {symbol}")
+            self.logger.info("Retrieved %d bars for %s", len(bars), symbol)
             
             # Convert to DataFrame
-            data = []
-            for bar in bars:
-                data.append({
-                    'timestamp': bar.t,
-                    'open': float(bar.o),
-                    'high': float(bar.h),
-                    'low': float(bar.l),
-                    'close': float(bar.c),
-                    'volume': int(bar.v)
-                })
-            
-            df = pd.DataFrame(data)
-            df.set_index('timestamp', inplace=True)
-            return df
+            return _bars_to_frame(
+                [bar.t for bar in bars],
+                ((bar.o, bar.h, bar.l, bar.c, bar.v) for bar in bars),
+                len(bars),
+                dtype=_BAR_DTYPE_INT_VOLUME
+            )
             
         except Exception as e:
-            self.logger.warning(f"Old API failed for {symbol}: {e}")
+            self.logger.warning("Old API failed for %s: %s", symbol, e)
             
             # Final fallback: yfinance for crypto
             if '/' in symbol:
-                self.logger.info(f"Trying yfinance fallback for {symbol}...")
+                self.logger.info("Trying yfinance fallback for %s...", symbol)
                 try:
                     import yfinance as yf
                     yf_symbol = symbol.replace('/', '-')
@@ -386,16 +647,122 @@ class AlpacaClient:
                     hist = ticker.history(period="6mo", interval="1d")
                     
                     if not hist.empty:
-                        df = hist.copy()
-                        df.columns = [col.lower() for col in df.columns]
-                        df = df.tail(limit)
-                        self.logger.info(f"Yfinance fallback: Retrieved {len(df)} bars for {symbol}")
+                        hist.rename(columns=str.lower, inplace=True)
+                        df = hist.tail(limit)
+                        self.logger.info("Yfinance fallback: Retrieved %d bars for %s", len(df), symbol)
                         return df
                 except Exception as yf_error:
-                    self.logger.warning(f"Yfinance fallback failed for {symbol}: {yf_error}")
+                    self.logger.warning("Yfinance fallback failed for %s: %s", symbol, yf_error)
+            
+            self.logger.error("All methods failed to get bars for %s", symbol)
+            return None
+    
+    async def get_bars_many(self, symbols: List[str], timeframe: str = '1Day', limit: int = 100,
+                            max_concurrency: int = 32, retry_count: int = 3) -> Dict[str, Optional[pd.DataFrame]]:
+        """Get historical bars for many symbols concurrently
+        
+        Requests go straight to the market data REST API over one pooled
+        aiohttp session, so N symbols cost roughly one round-trip instead of N.
+        Falls back to sequential get_bars() calls when aiohttp isn't installed.
+        """
+        if aiohttp is None:
+            self.logger.info("aiohttp not installed, fetching bars sequentially")
+            return {symbol: self.get_bars(symbol, timeframe, limit) for symbol in symbols}
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=64)
+        async with aiohttp.ClientSession(connector=connector, headers=self._data_headers) as session:
+            frames = await asyncio.gather(*(
+                self._get_bars_async(session, semaphore, symbol, timeframe, limit, retry_count)
+                for symbol in symbols
+            ))
+        
+        return dict(zip(symbols, frames))
+    
+    async def get_bars_raw(self, symbol: str, timeframe: str = '1Day', limit: int = 100,
+                           retry_count: int = 3) -> Optional[pd.DataFrame]:
+        """Get historical bars for one symbol straight from the REST API
+        
+        Skips alpaca-py's per-bar model objects; the JSON bar dicts go directly
+        into the DataFrame. Returns None if aiohttp isn't installed.
+        """
+        if aiohttp is None:
+            return None
+        
+        semaphore = asyncio.Semaphore(1)
+        async with aiohttp.ClientSession(headers=self._data_headers) as session:
+            return await self._get_bars_async(session, semaphore, symbol, timeframe, limit, retry_count)
+    
+    async def _get_bars_async(self, session, semaphore: asyncio.Semaphore, symbol: str,
+                              timeframe: str, limit: int, retry_count: int) -> Optional[pd.DataFrame]:
+        """Fetch one symbol's most recent `limit` bars from the market data REST API"""
+        is_crypto = self._is_crypto(symbol)
+        
+        # Newest first, so the first page holds the latest bars whatever the timeframe;
+        # follow next_page_token only while fewer than `limit` bars have arrived
+        now = datetime.now()
+        params = {
+            'timeframe': timeframe,
+            'start': (now - timedelta(days=min(limit * 2, 365))).date().isoformat(),
+            'end': now.date().isoformat(),
+            'sort': 'desc'
+        }
+        if is_crypto:
+            pair = self._crypto_pair(symbol)
+            url = f"{self.data_url}/v1beta3/crypto/us/bars"
+            params['symbols'] = pair
+        else:
+            url = f"{self.data_url}/v2/stocks/{symbol}/bars"
+        
+        bars = []
+        while len(bars) < limit:
+            params['limit'] = min(limit - len(bars), 10000)
+            payload = await self._get_json_async(session, semaphore, url, params, symbol, retry_count)
+            if payload is None:
+                return None
             
-            self.logger.error(f"All methods failed to get bars for {symbol}")
+            page = (payload.get('bars') or {}).get(pair) if is_crypto else payload.get('bars')
+            bars.extend(page or ())
+            params['page_token'] = payload.get('next_page_token')
+            if not page or not params['page_token']:
+                break
+        
+        if not bars:
+            self.logger.warning("No bars returned from REST API for %s", symbol)
             return None
+        
+        bars.reverse()
+        return _bars_to_frame(
+            [bar['t'] for bar in bars],
+            ((bar['o'], bar['h'], bar['l'], bar['c'], bar.get('v') or 0) for bar in bars),
+            len(bars)
+        )
+    
+    async def _get_json_async(self, session, semaphore: asyncio.Semaphore, url: str, params: Dict,
+                              symbol: str, retry_count: int) -> Optional[Dict]:
+        """GET one market data page, retrying connection errors and 429s with backoff"""
+        for attempt in range(retry_count):
+            try:
+                async with semaphore:
+                    async with session.get(url, params={k: v for k, v in params.items() if v is not None}) as response:
+                        if response.status == 429:
+                            raise ConnectionError("rate limited (HTTP 429)")
+                        response.raise_for_status()
+                        return _json_loads(await response.read())
+                
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError, ConnectionError) as e:
+                if attempt < retry_count - 1:
+                    wait_time = _backoff_delay(attempt)
+                    self.logger.warning("Connection error for %s (attempt %d): %s. Retrying in %.1fs...", symbol, attempt + 1, e, wait_time)
+                    await asyncio.sleep(wait_time)
+                else:
+                    self.logger.error("REST API failed for %s after %d attempts: %s", symbol, retry_count, e)
+                    return None
+            except Exception as e:
+                self.logger.error("REST API failed for %s: %s", symbol, e)
+                return None
+        
+        return None
     
     def get_latest_trade(self, symbol: str) -> Optional[Dict]:
         """Get latest trade for a symbol"""
@@ -415,38 +782,83 @@ class AlpacaClient:
     
     def get_latest_quote(self, symbol: str) -> Optional[Dict]:
         """Get latest quote for a symbol"""
+        return self._cached(f'alpaca:quote:{symbol}', self.QUOTE_TTL,
+                            lambda: self._fetch_latest_quote(symbol))
+    
+    def get_latest_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get latest quotes for many symbols with one request per asset class"""
+        quotes = {}
+        try:
+            if NEW_ALPACA:
+                from alpaca.data.requests import LatestCryptoTradesRequest, LatestQuotesRequest
+                cryptos = [s for s in symbols if self._is_crypto(s)]
+                stocks = [s for s in symbols if not self._is_crypto(s)]
+                
+                if cryptos:
+                    # For crypto, use the latest trade as both bid and ask
+                    trades = self.crypto_data_client.get_crypto_latest_trades(
+                        LatestCryptoTradesRequest(symbol_or_symbols=cryptos))
+                    for sym, trade in trades.items():
+                        quotes[sym] = self._trade_to_quote(sym, trade)
+                if stocks:
+                    stock_quotes = self.stock_data_client.get_stock_latest_quotes(
+                        LatestQuotesRequest(symbol_or_symbols=stocks))
+                    for sym, quote in stock_quotes.items():
+                        quotes[sym] = self._quote_to_dict(sym, quote)
+            else:
+                for sym, quote in self.api.get_latest_quotes(symbols).items():
+                    quotes[sym] = self._quote_to_dict(sym, quote)
+        except Exception as e:
+            self.logger.warning(f"Batched quote request failed, fetching individually: {e}")
+        
+        # Symbols the batch didn't cover go through the single-symbol path and its fallbacks
+        for sym in symbols:
+            if sym not in quotes:
+                quote = self.get_latest_quote(sym)
+                if quote:
+                    quotes[sym] = quote
+        
+        return quotes
+    
+    @staticmethod
+    def _quote_to_dict(symbol: str, quote) -> Dict:
+        return {
+            'symbol': symbol,
+            'bid': float(quote.bid_price),
+            'ask': float(quote.ask_price),
+            'bid_size': int(quote.bid_size),
+            'ask_size': int(quote.ask_size),
+            'timestamp': quote.timestamp
+        }
+    
+    @staticmethod
+    def _trade_to_quote(symbol: str, trade) -> Dict:
+        # Use trade price as both bid and ask
+        return {
+            'symbol': symbol,
+            'bid': float(trade.price),
+            'ask': float(trade.price),
+            'bid_size': int(trade.size),
+            'ask_size': int(trade.size),
+            'timestamp': trade.timestamp
+        }
+    
+    def _fetch_latest_quote(self, symbol: str) -> Optional[Dict]:
         try:
             if NEW_ALPACA:
                 # Use new API - not all symbols support quotes, fallback to trades
                 try:
-                    if '/' in symbol:  # Crypto
+                    if self._is_crypto(symbol):  # Crypto
                         # For crypto, get latest trade instead of quote
                         from alpaca.data.requests import LatestCryptoTradesRequest
                         request = LatestCryptoTradesRequest(symbol_or_symbols=[symbol])
                         trade_response = self.crypto_data_client.get_crypto_latest_trades(request)
-                        trade = trade_response[symbol]
-                        # Use trade price as both bid and ask
-                        return {
-                            'symbol': symbol,
-                            'bid': float(trade.price),
-                            'ask': float(trade.price),
-                            'bid_size': int(trade.size),
-                            'ask_size': int(trade.size),
-                            'timestamp': trade.timestamp
-                        }
+                        return self._trade_to_quote(symbol, trade_response[symbol])
                     else:  # Stock
                         from alpaca.data.requests import LatestQuotesRequest
                         request = LatestQuotesRequest(symbol_or_symbols=[symbol])
                         quote_response = self.stock_data_client.get_stock_latest_quotes(request)
-                        quote = quote_response[symbol]
-                        return {
-                            'symbol': symbol,
-                            'bid': float(quote.bid_price),
-                            'ask': float(quote.ask_price),
-                            'bid_size': int(quote.bid_size),
-                            'ask_size': int(quote.ask_size),
-                            'timestamp': quote.timestamp
-                        }
+                        return self._quote_to_dict(symbol, quote_response[symbol])
                 except Exception:
                     # Fallback to getting price from recent bars
                     bars = self.get_bars(symbol, limit=1)
@@ -463,15 +875,7 @@ class AlpacaClient:
                     return None
             else:
                 # Use old API
-                quote = self.api.get_latest_quote(symbol)
-                return {
-                    'symbol': symbol,
-                    'bid': float(quote.bid_price),
-                    'ask': float(quote.ask_price),
-                    'bid_size': int(quote.bid_size),
-                    'ask_size': int(quote.ask_size),
-                    'timestamp': quote.timestamp
-                }
+                return self._quote_to_dict(symbol, self.api.get_latest_quote(symbol))
             
         except Exception as e:
             self.logger.error(f"Failed to get quote for {symbol}: {e}")
@@ -492,16 +896,19 @@ class AlpacaClient:
             if NEW_ALPACA:
                 # Use new API
                 # Use appropriate time-in-force based on asset type
-                is_crypto = '/' in symbol or symbol.endswith('USD')
+                is_crypto = self._is_crypto(symbol)
                 tif = AlpacaTimeInForce.GTC if is_crypto else AlpacaTimeInForce.DAY
                 
+                order_id = None
                 if order_type == OrderType.MARKET:
-                    order_request = MarketOrderRequest(
-                        symbol=symbol,
-                        qty=qty,
-                        side=AlpacaOrderSide.BUY if side == OrderSide.BUY else AlpacaOrderSide.SELL,
-                        time_in_force=tif
-                    )
+                    order_id = self._submit_market_raw(symbol, qty, side.value, tif.value)
+                    if order_id is None:
+                        order_request = MarketOrderRequest(
+                            symbol=symbol,
+                            qty=qty,
+                            side=AlpacaOrderSide.BUY if side == OrderSide.BUY else AlpacaOrderSide.SELL,
+                            time_in_force=tif
+                        )
                 else:
                     order_request = LimitOrderRequest(
                         symbol=symbol,
@@ -511,9 +918,11 @@ class AlpacaClient:
                         limit_price=limit_price
                     )
                 
-                order = self.trading_client.submit_order(order_data=order_request)
-                self.logger.info(f"Order placed (new API): {order.id} - {side.value} {qty} {symbol}")
-                return str(order.id)
+                if order_id is None:
+                    order_id = str(self.trading_client.submit_order(order_data=order_request).id)
+                self._invalidate('alpaca:acct', 'alpaca:pos')
+                self.logger.info(f"Order placed (new API): {order_id} - {side.value} {qty} {symbol}")
+                return order_id
                 
             else:
                 # Use old API
@@ -535,6 +944,7 @@ class AlpacaClient:
                     order_params['trail_price'] = trail_price
                 
                 order = self.api.submit_order(**order_params)
+                self._invalidate('alpaca:acct', 'alpaca:pos')
                 self.logger.info(f"Order placed (old API): {order.id} - {side.value} {qty} {symbol}")
                 return order.id
             
@@ -542,6 +952,37 @@ class AlpacaClient:
             self.logger.error(f"Failed to place order for {symbol}: {e}")
             return None
     
+    def _submit_market_raw(self, symbol: str, qty: float, side: str, time_in_force: str) -> Optional[str]:
+        """POST a market order directly, skipping alpaca-py's request model validation
+        
+        Returns the order id, or None if the trading client doesn't expose the
+        session/auth internals this relies on (callers then use submit_order).
+        HTTP errors are raised rather than retried through the model path, so a
+        request that may have reached Alpaca is never submitted twice.
+        """
+        client = self.trading_client
+        # Private alpaca-py attributes (stable through the pinned version range) - fall back if they move
+        if not all(hasattr(client, attr) for attr in ('_session', '_base_url', '_get_default_headers')):
+            return None
+        session = client._session
+        url = getattr(client._base_url, 'value', client._base_url) + '/v2/orders'
+        headers = dict(client._get_default_headers())
+        
+        payload = {
+            'symbol': symbol,
+            'qty': str(qty),
+            'side': side,
+            'type': 'market',
+            'time_in_force': time_in_force
+        }
+        body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+        headers['Content-Type'] = 'application/json'
+        
+        response = session.post(url, data=body, headers=headers, allow_redirects=False, timeout=10)
+        if response.status_code >= 400:
+            raise RuntimeError(f"order rejected (HTTP {response.status_code}): {response.text}")
+        return str(_json_loads(response.content)['id'])
+    
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an order"""
         try:
@@ -553,6 +994,39 @@ class AlpacaClient:
             self.logger.error(f"Failed to cancel order {order_id}: {e}")
             return False
     
+    def start_trade_stream(self, handler) -> bool:
+        """Push order updates (fills, cancels, ...) to an async handler from a background websocket thread"""
+        if not NEW_ALPACA:
+            return False
+        try:
+            from alpaca.trading.stream import TradingStream
+            
+            self._trade_stream = TradingStream(
+                self._credentials['ALPACA_API_KEY'],
+                self._credentials['ALPACA_SECRET_KEY'],
+                paper=False  # Must match trading_client
+            )
+            self._trade_stream.subscribe_trade_updates(handler)
+            threading.Thread(target=self._trade_stream.run, name='trade-stream', daemon=True).start()
+            self.logger.info("Trade updates stream started")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to start trade updates stream: {e}")
+            self._trade_stream = None
+            return False
+    
+    def stop_trade_stream(self):
+        """Close the trade updates websocket if it is running"""
+        if self._trade_stream is None:
+            return
+        try:
+            self._trade_stream.stop()
+        except Exception as e:
+            self.logger.warning(f"Error stopping trade updates stream: {e}")
+        finally:
+            self._trade_stream = None
+    
     def cancel_all_orders(self) -> bool:
         """Cancel all open orders"""
         try:
@@ -572,12 +1046,7 @@ class AlpacaClient:
         try:
             if NEW_ALPACA:
                 # Use new API - close position by placing opposite order
-                positions = self.trading_client.get_all_positions()
-                position = None
-                for pos in positions:
-                    if pos.symbol == symbol:
-                        position = pos
-                        break
+                position = self.get_open_position(symbol)
                 
                 if not position:
                     self.logger.warning(f"No position found for {symbol}")
@@ -596,22 +1065,24 @@ class AlpacaClient:
                 
                 # Place market order to close position
                 # For crypto, try GTC (Good Till Canceled) which is more widely supported
-                is_crypto = '/' in symbol or symbol.endswith('USD')
+                is_crypto = self._is_crypto(symbol)
                 if is_crypto:
                     tif = AlpacaTimeInForce.GTC
                 else:
                     tif = AlpacaTimeInForce.DAY
                 
-                order_request = MarketOrderRequest(
-                    symbol=symbol,
-                    qty=close_qty,
-                    side=side,
-                    time_in_force=tif
-                )
-                
-                order = self.trading_client.submit_order(order_data=order_request)
+                order_id = self._submit_market_raw(symbol, close_qty, side.value, tif.value)
+                if order_id is None:
+                    order_request = MarketOrderRequest(
+                        symbol=symbol,
+                        qty=close_qty,
+                        side=side,
+                        time_in_force=tif
+                    )
+                    order_id = str(self.trading_client.submit_order(order_data=order_request).id)
+                self._invalidate('alpaca:acct', 'alpaca:pos')
                 self.logger.info(f"Position closed (new API): {symbol} - {close_qty} shares")
-                return str(order.id)
+                return order_id
                 
             else:
                 # Use old API
@@ -622,6 +1093,7 @@ class AlpacaClient:
                 else:
                     order = self.api.close_position(symbol)
                 
+                self._invalidate('alpaca:acct', 'alpaca:pos')
                 self.logger.info(f"Position closed (old API): {symbol}")
                 return order.id if hasattr(order, 'id') else str(order)
             
@@ -629,6 +1101,26 @@ class AlpacaClient:
             self.logger.error(f"Failed to close position for {symbol}: {e}")
             return None
     
+    def get_open_position(self, symbol: str) -> Optional[Position]:
+        """Fetch the single open position for symbol straight from the API (None if there isn't one)
+        
+        Bypasses the positions cache. Only a 404 means "no position"; any other
+        API error is raised so callers never mistake an outage for a flat position.
+        """
+        # Positions are keyed without the slash ('SOL/USD' -> 'SOLUSD')
+        position_symbol = symbol.replace('/', '')
+        try:
+            if NEW_ALPACA:
+                pos = self.trading_client.get_open_position(position_symbol)
+            else:
+                pos = self.api.get_position(position_symbol)
+        except Exception as e:
+            if getattr(e, 'status_code', None) == 404:
+                return None
+            raise
+        return Position(pos.symbol, float(pos.qty), pos.side, float(pos.market_value), float(pos.cost_basis),
+                        float(pos.unrealized_pl), float(pos.unrealized_plpc), float(pos.avg_entry_price))
+    
     def get_portfolio_history(self, timeframe: str = '1D', extended_hours: bool = False) -> Optional[Dict]:
         """Get portfolio performance history"""
         try:
@@ -650,7 +1142,55 @@ class AlpacaClient:
             return None
     
     def is_market_open(self) -> bool:
-        """Check if market is currently open with retry logic"""
+        """Check if market is currently open"""
+        # Today's open/close times are fixed, so after one calendar lookup per
+        # day this is a local time comparison with no network traffic
+        now_et = datetime.now(_ET_TZ)
+        session = self._get_trading_session(now_et.date())
+        if session is not None:
+            open_dt, close_dt = session
+            return open_dt is not None and open_dt <= now_et < close_dt
+        
+        # Calendar unavailable - ask the clock instead
+        return bool(self._cached('alpaca:clock', self.CLOCK_TTL, self._fetch_market_open))
+    
+    def _get_trading_session(self, day) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
+        """Regular session (open, close) for an ET date, fetched at most once per day"""
+        if self._session_cache is not None and self._session_cache[0] == day:
+            return self._session_cache[1]
+        
+        session = self._fetch_trading_session(day)
+        if session is not None:
+            self._session_cache = (day, session)
+        return session
+    
+    def _fetch_trading_session(self, day) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
+        """Look up one day in the market calendar (None on failure)"""
+        try:
+            if NEW_ALPACA:
+                from alpaca.trading.requests import GetCalendarRequest
+                calendar = self.trading_client.get_calendar(GetCalendarRequest(start=day, end=day))
+            else:
+                calendar = self.api.get_calendar(start=day.isoformat(), end=day.isoformat())
+            
+            for entry in calendar:
+                if pd.Timestamp(entry.date).date() != day:
+                    continue
+                # alpaca-py returns datetimes, alpaca-trade-api returns times
+                open_t = entry.open.time() if isinstance(entry.open, datetime) else entry.open
+                close_t = entry.close.time() if isinstance(entry.close, datetime) else entry.close
+                return (_ET_TZ.localize(datetime.combine(day, open_t)),
+                        _ET_TZ.localize(datetime.combine(day, close_t)))
+            
+            # Weekend or holiday
+            return (None, None)
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to get market calendar for {day}: {e}")
+            return None
+    
+    def _fetch_market_open(self) -> Optional[bool]:
+        """Ask the Alpaca clock whether the market is open, with retry logic (None on failure)"""
         for attempt in range(3):
             try:
                 if NEW_ALPACA:
@@ -660,15 +1200,15 @@ class AlpacaClient:
                 return clock.is_open
             except (ConnectionResetError, ConnectionError, ConnectionAbortedError) as e:
                 if attempt < 2:
-                    time.sleep(2)
+                    time.sleep(_backoff_delay(attempt))
                     continue
                 else:
                     self.logger.warning(f"Failed to get market status after retries, assuming closed: {e}")
-                    return False
+                    return None
             except Exception as e:
                 self.logger.error(f"Failed to get market status: {e}")
-                return False
-        return False
+                return None
+        return None
     
     def get_market_calendar(self, start: datetime = None, end: datetime = None) -> List[Dict]:
         """Get market calendar"""
@@ -695,15 +1235,22 @@ class AlpacaClient:
             self.logger.error(f"Failed to get market calendar: {e}")
             return []
     
-    def calculate_position_size(self, symbol: str, risk_amount: float, stop_loss_price: float) -> int:
-        """Calculate position size based on risk management"""
+    def calculate_position_size(self, symbol: str, risk_amount: float, stop_loss_price: float,
+                                quote: Optional[Dict] = None) -> int:
+        """Calculate position size based on risk management.
+        
+        Pass a quote from get_latest_quotes() to skip the per-symbol quote request.
+        """
         try:
             # Get current price
-            quote = self.get_latest_quote(symbol)
+            if quote is None:
+                quote = self.get_latest_quote(symbol)
             if not quote:
                 return 0
             
             current_price = (quote['bid'] + quote['ask']) / 2
+            if current_price <= 0:
+                return 0
             risk_per_share = abs(current_price - stop_loss_price)
             
             if risk_per_share <= 0:
@@ -714,4 +1261,23 @@ class AlpacaClient:
             
         except Exception as e:
             self.logger.error(f"Failed to calculate position size for {symbol}: {e}")
-            return 0
\ No newline at end of file
+            return 0
+    
+    def calculate_position_sizes(self, symbols: List[str], risk_amounts, stop_prices) -> Dict[str, int]:
+        """Vectorised calculate_position_size over many symbols (one batched quote fetch)"""
+        try:
+            quotes = self.get_latest_quotes(symbols)
+            mids = np.array([(quotes[s]['bid'] + quotes[s]['ask']) / 2 if s in quotes else np.nan
+                             for s in symbols], dtype=np.float64)
+            risks = np.abs(mids - np.asarray(stop_prices, dtype=np.float64))
+            
+            # Symbols without a usable quote or without risk get 0, everything else at least 1
+            valid = (mids > 0) & np.isfinite(risks) & (risks > 0)
+            raw = np.divide(np.asarray(risk_amounts, dtype=np.float64), risks,
+                            out=np.zeros_like(risks), where=valid)
+            sizes = np.where(valid, np.maximum(1, raw.astype(np.int64)), 0)
+            return dict(zip(symbols, sizes.tolist()))
+            
+        except Exception as e:
+            self.logger.error(f"Failed to calculate position sizes: {e}")
+            return {s: 0 for s in symbols}
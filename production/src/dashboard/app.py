@@ -6,47 +6,228 @@ Simple Flask web interface for monitoring bot performance and configuration.
 
 import sys
 import os
+import bisect
 import json
-from flask import Flask, render_template, jsonify, request, redirect, url_for
+import hashlib
+import pandas as pd
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
+from flask import (Flask, Response, make_response, render_template, jsonify,
+                   request, redirect, url_for)
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
+from jinja2 import FileSystemBytecodeCache
 from datetime import datetime, timedelta
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Make src/ importable when run as a script. Done once, and put first so the
+# bot's packages resolve on the first sys.path entry instead of after site-packages.
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from utils.config_manager import get_config
 from api.alpaca_client import AlpacaClient
 from utils.logger import TradingLogger
 
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify() backed by orjson; falls back to Flask's default() for Decimal/dataclass values"""
+    
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS if orjson is not None else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
 app.secret_key = 'trading-bot-dashboard-key'  # Change in production
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
+# Templates are fixed in production: skip the per-render mtime check (the
+# on-disk bytecode cache is enabled when the app is started)
+_JINJA_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'rsi-trading-bot', 'jinja')
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+
+# Brotli/gzip-encode responses for clients that accept it (skips small bodies)
+if Compress is not None:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    Compress(app)
+
+# Short-lived response cache so polling browsers share upstream Alpaca calls
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
 
 # Global objects
 config_manager = None
 alpaca_client = None
 trading_logger = None
 
+POSITION_SUMMARY_COLUMNS = ['symbol', 'qty', 'market_value', 'unrealized_pl',
+                            'unrealized_plpc', 'avg_entry_price']
+POSITION_API_COLUMNS = POSITION_SUMMARY_COLUMNS + ['side']
+DASHBOARD_MAX_POSITIONS = 25
+
+# Seconds between background refreshes of the account/positions/orders snapshot
+SNAPSHOT_INTERVAL = 2.0
+_refresher_thread = None
+
+# Runs the dashboard's independent upstream calls side by side
+_executor = ThreadPoolExecutor(max_workers=4)
+
+# Single-flight bookkeeping: key -> Future of the call currently in progress
+_inflight = {}
+_inflight_lock = threading.Lock()
+
 def initialize_components():
     """Initialize bot components"""
-    global config_manager, alpaca_client, trading_logger
+    global config_manager, alpaca_client, trading_logger, _refresher_thread
     try:
         config_manager = get_config()
         alpaca_client = AlpacaClient(config_manager)
         trading_logger = TradingLogger(config_manager)
+        
+        # Views read Snapshot instead of calling Alpaca per request
+        if _refresher_thread is None:
+            _refresher_thread = threading.Thread(target=_refresher, name='snapshot-refresher', daemon=True)
+            _refresher_thread.start()
         return True
     except Exception as e:
         print(f"Failed to initialize components: {e}")
         return False
 
+def _cache_ok(rv):
+    """Only cache successful responses; error paths return a (body, status) tuple"""
+    return not isinstance(rv, tuple)
+
+def etagged(max_age: int):
+    """Add Cache-Control and a weak ETag to successful responses; answer matching If-None-Match with 304"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            resp = make_response(view(*args, **kwargs))
+            if resp.status_code == 200:
+                resp.set_etag(hashlib.blake2b(resp.get_data(), digest_size=8).hexdigest(), weak=True)
+                resp.cache_control.public = True
+                resp.cache_control.max_age = max_age
+                resp = resp.make_conditional(request)
+            return resp
+        return wrapper
+    return decorator
+
+def _coalesced(key: str, fn, *args, **kwargs):
+    """Run fn once for all concurrent callers using the same key
+    
+    The first caller makes the upstream request; callers arriving while it is
+    in flight wait for and share its result (or exception).
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    
+    if not leader:
+        return future.result()
+    
+    try:
+        result = fn(*args, **kwargs)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+def _trade_log_mtime() -> int:
+    """Trade log modification time, the cache key for everything derived from it"""
+    try:
+        return os.stat(trading_logger.log_paths['trade_log']).st_mtime_ns
+    except OSError:
+        return 0
+
+@lru_cache(maxsize=4)
+def _perf_cached(mtime):
+    return trading_logger.calculate_performance_metrics()
+
+@lru_cache(maxsize=4)
+def _rankings_cached(mtime):
+    return trading_logger.get_symbol_rankings()
+
+@lru_cache(maxsize=4)
+def _recent_trades_cached(mtime, limit=50):
+    return trading_logger.load_recent_trades(limit)
+
+class Snapshot:
+    """Latest account, positions frame and recent orders, kept fresh by _refresher"""
+    lock = threading.RLock()
+    account = None
+    positions = None
+    orders = None
+    ts = 0.0
+
+def _fetch_snapshot():
+    """Fetch account, positions and recent orders from Alpaca side by side"""
+    account = _executor.submit(alpaca_client.get_account)
+    positions = _executor.submit(alpaca_client.get_positions_frame)
+    orders = _executor.submit(alpaca_client.get_orders, status="all", limit=10)
+    return account.result(), positions.result(), orders.result()
+
+def _refresher():
+    """Background loop that refreshes Snapshot every SNAPSHOT_INTERVAL seconds"""
+    while True:
+        try:
+            account, positions, orders = _fetch_snapshot()
+            with Snapshot.lock:
+                Snapshot.account, Snapshot.positions, Snapshot.orders = account, positions, orders
+                Snapshot.ts = time.monotonic()
+        except Exception as e:
+            print(f"Dashboard snapshot refresh failed: {e}")
+        time.sleep(SNAPSHOT_INTERVAL)
+
+def _snapshot():
+    """(account, positions frame, orders) from the background snapshot
+    
+    Falls back to a coalesced live fetch until the refresher has data, or if
+    it has stalled for several intervals.
+    """
+    with Snapshot.lock:
+        if Snapshot.account is not None and time.monotonic() - Snapshot.ts < SNAPSHOT_INTERVAL * 5:
+            return Snapshot.account, Snapshot.positions, Snapshot.orders
+    return _coalesced('snapshot', _fetch_snapshot)
+
 @app.route('/')
 def dashboard():
-    """Main dashboard"""
+    """Main dashboard (static shell; data comes from /api/dashboard)"""
+    return render_template('dashboard_shell.html')
+
+@app.route('/api/dashboard')
+@etagged(max_age=2)
+@cache.cached(timeout=2, response_filter=_cache_ok)
+def api_dashboard():
+    """API endpoint for the combined dashboard snapshot"""
     try:
-        # Get account information
-        account = alpaca_client.get_account()
-        positions = alpaca_client.get_positions()
+        # Performance metrics read the trade log while the Alpaca calls are in flight
+        performance_future = _executor.submit(_perf_cached, _trade_log_mtime())
         
-        # Get recent orders
-        orders = alpaca_client.get_orders(status="all", limit=10)
+        # Get account information, positions and recent orders
+        account, positions, orders = _snapshot()
         
         # Calculate portfolio metrics
         portfolio_data = {
@@ -58,20 +239,14 @@ def dashboard():
             'status': account.status
         }
         
-        # Position summary
-        position_data = []
-        total_unrealized_pl = 0
-        
-        for pos in positions:
-            position_data.append({
-                'symbol': pos.symbol,
-                'qty': pos.qty,
-                'market_value': pos.market_value,
-                'unrealized_pl': pos.unrealized_pl,
-                'unrealized_plpc': pos.unrealized_plpc * 100,
-                'avg_entry_price': pos.avg_entry_price
-            })
-            total_unrealized_pl += pos.unrealized_pl
+        # Position summary, computed column-wise on the float64 positions frame
+        # Only the largest positions by absolute market value are rendered; the
+        # full list is paginated through /api/positions?offset=&limit=
+        largest = positions['market_value'].abs().sort_values(ascending=False).index[:DASHBOARD_MAX_POSITIONS]
+        summary = positions.loc[largest, POSITION_SUMMARY_COLUMNS]
+        summary = summary.assign(unrealized_plpc=summary['unrealized_plpc'] * 100)
+        position_data = summary.to_dict('records')
+        total_unrealized_pl = float(positions['unrealized_pl'].to_numpy().sum())
         
         # Recent orders
         order_data = []
@@ -86,7 +261,7 @@ def dashboard():
             })
         
         # Performance metrics
-        performance = trading_logger.calculate_performance_metrics()
+        performance = performance_future.result()
         perf_data = {}
         if performance:
             perf_data = {
@@ -100,21 +275,25 @@ def dashboard():
                 'max_drawdown': performance.max_drawdown
             }
         
-        return render_template('dashboard.html',
-                             portfolio=portfolio_data,
-                             positions=position_data,
-                             orders=order_data,
-                             performance=perf_data,
-                             total_unrealized_pl=total_unrealized_pl)
+        return jsonify({
+            'portfolio': portfolio_data,
+            'positions': position_data,
+            'position_count': len(positions),
+            'orders': order_data,
+            'performance': perf_data,
+            'total_unrealized_pl': total_unrealized_pl
+        })
         
     except Exception as e:
-        return f"Error loading dashboard: {e}", 500
+        return jsonify({'error': str(e)}), 500
 
 @app.route('/api/account')
+@etagged(max_age=2)
+@cache.cached(timeout=2, response_filter=_cache_ok)
 def api_account():
     """API endpoint for account data"""
     try:
-        account = alpaca_client.get_account()
+        account = _snapshot()[0]
         return jsonify({
             'portfolio_value': float(account.portfolio_value),
             'buying_power': float(account.buying_power),
@@ -126,32 +305,30 @@ def api_account():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/positions')
+@etagged(max_age=3)
+@cache.cached(timeout=3, response_filter=_cache_ok, query_string=True)
 def api_positions():
-    """API endpoint for positions data"""
+    """API endpoint for positions data (optional ?offset=&limit= paging)"""
     try:
-        positions = alpaca_client.get_positions()
-        position_data = []
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        limit = request.args.get('limit', type=int)
+        end = offset + limit if limit is not None else None
         
-        for pos in positions:
-            position_data.append({
-                'symbol': pos.symbol,
-                'qty': float(pos.qty),
-                'market_value': float(pos.market_value),
-                'unrealized_pl': float(pos.unrealized_pl),
-                'unrealized_plpc': float(pos.unrealized_plpc) * 100,
-                'avg_entry_price': float(pos.avg_entry_price),
-                'side': pos.side
-            })
-        
-        return jsonify(position_data)
+        # The positions frame already holds float64 columns, so rows convert in bulk
+        df = _snapshot()[1][POSITION_API_COLUMNS]
+        df = df.iloc[offset:end]
+        df = df.assign(unrealized_plpc=df['unrealized_plpc'] * 100)
+        return jsonify(df.to_dict('records'))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/performance')
+@etagged(max_age=15)
+@cache.cached(timeout=15, response_filter=_cache_ok)
 def api_performance():
     """API endpoint for performance metrics"""
     try:
-        performance = trading_logger.calculate_performance_metrics()
+        performance = _perf_cached(_trade_log_mtime())
         
         if not performance:
             return jsonify({'error': 'No performance data available'})
@@ -174,10 +351,12 @@ def api_performance():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/symbol_rankings')
+@etagged(max_age=15)
+@cache.cached(timeout=15, response_filter=_cache_ok)
 def api_symbol_rankings():
     """API endpoint for symbol performance rankings"""
     try:
-        rankings = trading_logger.get_symbol_rankings()
+        rankings = _rankings_cached(_trade_log_mtime())
         
         ranking_data = []
         for rank in rankings[:20]:  # Top 20
@@ -207,7 +386,8 @@ def api_config():
     """API endpoint for configuration management"""
     if request.method == 'GET':
         try:
-            return jsonify(config_manager.config)
+            # Serialized once per config load/save rather than on every request
+            return Response(config_manager.config_bytes, mimetype='application/json')
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     
@@ -232,62 +412,97 @@ def api_config():
         except Exception as e:
             return jsonify({'error': str(e)}), 500
 
+def _trade_rows(df):
+    """Trade rows for the template, with timestamps formatted column-wise"""
+    if 'timestamp' in df.columns:
+        raw = df['timestamp']
+        parsed = pd.to_datetime(raw, errors='coerce', format='ISO8601')
+        # Unparseable values are shown as logged
+        df = df.assign(timestamp=parsed.dt.strftime('%Y-%m-%d %H:%M:%S').fillna(raw.astype(str)))
+    return df.to_dict('records')
+
 @app.route('/trades')
 def trades_page():
     """Trade history page"""
     try:
-        # Load trade history
-        df = trading_logger.load_trade_history()
-        
-        if df.empty:
-            trades = []
-        else:
-            # Convert to list of dictionaries for template
-            trades = df.tail(50).to_dict('records')  # Last 50 trades
-            
-            # Format timestamps
-            for trade in trades:
-                if 'timestamp' in trade:
-                    try:
-                        dt = datetime.fromisoformat(trade['timestamp'])
-                        trade['timestamp'] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                    except:
-                        pass
+        # Load the last 50 trades only
+        df = _recent_trades_cached(_trade_log_mtime())
         
+        trades = _trade_rows(df) if not df.empty else []
         return render_template('trades.html', trades=trades)
         
     except Exception as e:
         return f"Error loading trades: {e}", 500
 
+# (epoch second, ISO timestamp, date) of the last clock read
+_clock_cache = (0, '', None)
+
+def _now_cached():
+    """Current (ISO timestamp, date), read from the system clock at most once per second"""
+    global _clock_cache
+    second = int(time.time())
+    if second != _clock_cache[0]:
+        now = datetime.now()
+        _clock_cache = (second, now.isoformat(), now.date())
+    return _clock_cache[1], _clock_cache[2]
+
+@lru_cache(maxsize=1)
+def _calendar_sorted(day_ordinal):
+    """Market calendar fetched once per day, plus its (ascending) dates for bisecting"""
+    calendar = alpaca_client.get_market_calendar()
+    dates = [day['date'].date() if hasattr(day['date'], 'date') else day['date'] for day in calendar]
+    return calendar, dates
+
 @app.route('/api/market_status')
+@etagged(max_age=5)
+@cache.cached(timeout=5, response_filter=_cache_ok)
 def api_market_status():
     """API endpoint for market status"""
     try:
-        is_open = alpaca_client.is_market_open()
-        calendar = alpaca_client.get_market_calendar()
+        is_open = _coalesced('market_open', alpaca_client.is_market_open)
+        current_time, today = _now_cached()
+        calendar, dates = _calendar_sorted(today.toordinal())
+        if not calendar:
+            # Don't hold on to a failed lookup for the rest of the day
+            _calendar_sorted.cache_clear()
         
         next_open = None
         next_close = None
         
-        if calendar:
-            today = datetime.now().date()
-            for day in calendar:
-                if day['date'] >= today:
-                    if not is_open:
-                        next_open = f"{day['date']} {day['open']}"
-                    next_close = f"{day['date']} {day['close']}"
-                    break
+        idx = bisect.bisect_left(dates, today)
+        if idx < len(calendar):
+            day = calendar[idx]
+            if not is_open:
+                next_open = f"{day['date']} {day['open']}"
+            next_close = f"{day['date']} {day['close']}"
         
         return jsonify({
             'is_open': is_open,
             'next_open': next_open,
             'next_close': next_close,
-            'current_time': datetime.now().isoformat()
+            'current_time': current_time
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _enable_template_bytecode_cache():
+    """Keep compiled templates across restarts; left off if the cache dir can't be created"""
+    try:
+        os.makedirs(_JINJA_CACHE_DIR, exist_ok=True)
+    except OSError as e:
+        print(f"Template bytecode cache disabled: {e}")
+        return
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=_JINJA_CACHE_DIR)
+
+def create_app():
+    """App factory for external WSGI servers: initializes components before serving"""
+    _enable_template_bytecode_cache()
+    if not initialize_components():
+        raise RuntimeError("Failed to initialize dashboard components")
+    return app
+
 if __name__ == '__main__':
+    _enable_template_bytecode_cache()
     if not initialize_components():
         print("Failed to initialize dashboard components")
         sys.exit(1)
@@ -295,4 +510,7 @@ if __name__ == '__main__':
     print("🚀 Starting Trading Bot Dashboard")
     print("📊 Dashboard will be available at: http://localhost:5000")
     
-    app.run(host='0.0.0.0', port=5001, debug=False)
+    # One thread per request so slow Alpaca calls don't block other views. For
+    # multi-worker deployments run under a production WSGI server instead, e.g.
+    #   gunicorn -k gevent -w 4 --chdir src 'dashboard.app:create_app()'
+    app.run(host='0.0.0.0', port=5001, debug=False, threaded=True)
@@ -9,13 +9,38 @@ import sys
 import os
 import time
 import logging
+import logging.handlers
+import atexit
 import json
+import hashlib
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Tuple
+from types import MappingProxyType
 import signal
 import threading
-from dataclasses import dataclass, asdict
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import time as dtime
+from functools import lru_cache
 import pytz
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import yfinance as yf
+except ImportError:
+    yf = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: refresh the yfinance cache without the cross-process lock
 
 # Add src directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -28,19 +53,82 @@ from strategy.simple_sentiment import SimpleSentimentAnalyzer
 from utils.risk_manager import RiskManager
 from utils.logger import TradingLogger
 from utils.notifications import NotificationManager
+from utils.fast_math import compute_close_metrics, SIDE_LONG, SIDE_SHORT
+
+# Trade direction for each agreeing (technical signal, sentiment recommendation,
+# sentiment direction) combination; anything missing is a conflict
+_DECISION_TABLE: Dict[Tuple[SignalType, str, str], str] = {
+    **{(SignalType.BUY, rec, direction): 'BUY'
+       for rec in ('STRONG_BUY', 'BUY') for direction in ('BULLISH', 'NEUTRAL')},
+    **{(SignalType.SELL, rec, direction): 'SELL'
+       for rec in ('STRONG_SELL', 'SELL') for direction in ('BEARISH', 'NEUTRAL')},
+}
+
+# Rewrite an unchanged status file at least this often so the dashboard's
+# 2-minute staleness check still sees the bot as running
+STATUS_HEARTBEAT_SECONDS = 60
+
+# Time-based exit for any open position
+MAX_HOLD_TIME = timedelta(hours=24)
+
+# How long to skip a symbol after it returned too few bars to analyze
+INSUFFICIENT_DATA_BACKOFF = 300
 
-@dataclass
+# On-disk cache of yfinance history used as the alternative crypto data source
+_YF_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'rsi-trading-bot', 'yf')
+YF_CACHE_TTL = 4 * 3600
+_ALT_DATA_COLUMNS = frozenset(('open', 'high', 'low', 'close', 'volume'))
+
+# Market-hours constants (premarket 4:00 AM, regular open 9:30 AM, close 4:00 PM ET)
+_ET_TZ = pytz.timezone('US/Eastern')
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_PREMARKET_START = dtime(4, 0)
+_REGULAR_OPEN = dtime(9, 30)
+_MARKET_CLOSE = dtime(16, 0)
+
+@lru_cache(maxsize=4)
+def _market_hours_decision(date, hour: int, minute: int) -> tuple[bool, str]:
+    """Stock market open/closed decision for one ET minute, with its log message"""
+    weekday_name = _WEEKDAY_NAMES[date.weekday()]
+    
+    # Skip weekends (Saturday=5, Sunday=6)
+    if date.weekday() >= 5:
+        return False, f"📅 Weekend detected ({weekday_name}) - stock market closed"
+    
+    current_time = dtime(hour, minute)
+    if current_time < _PREMARKET_START:
+        return False, f"🌙 Before premarket ({weekday_name}) - AMD scanning disabled"
+    if current_time > _MARKET_CLOSE:
+        return False, f"🌆 After market close ({weekday_name}) - AMD scanning disabled"
+    if current_time < _REGULAR_OPEN:
+        return True, f"🌅 Premarket hours ({weekday_name}) - AMD scanning enabled"
+    return True, f"🏢 Regular market hours ({weekday_name}) - AMD scanning enabled"
+
+@dataclass(slots=True)
 class BotStatus:
     """Bot status tracking"""
     enabled: bool = True
     running: bool = False
-    last_scan: Optional[str] = None
+    last_scan_epoch: int = 0  # time.time_ns() of the last scan, 0 if none yet
     active_trades: int = 0
     daily_pnl: float = 0.0
     scan_count: int = 0
     error_count: int = 0
+    
+    def to_dict(self) -> Dict:
+        """Shallow dict for status serialization (avoids asdict's deepcopy)"""
+        return {
+            'enabled': self.enabled,
+            'running': self.running,
+            'last_scan': (datetime.fromtimestamp(self.last_scan_epoch / 1e9).isoformat()
+                          if self.last_scan_epoch else None),
+            'active_trades': self.active_trades,
+            'daily_pnl': self.daily_pnl,
+            'scan_count': self.scan_count,
+            'error_count': self.error_count
+        }
 
-@dataclass
+@dataclass(slots=True)
 class ActiveTrade:
     """Active trade tracking"""
     symbol: str
@@ -54,15 +142,117 @@ class ActiveTrade:
     unrealized_pnl: float
     order_id: str
     reasons: List[str]
+    
+    def to_dict(self) -> Dict:
+        """Shallow dict for status serialization (avoids asdict's deepcopy)"""
+        return {
+            'symbol': self.symbol,
+            'side': self.side,
+            'quantity': self.quantity,
+            'entry_price': self.entry_price,
+            'entry_time': self.entry_time.isoformat(),
+            'stop_loss': self.stop_loss,
+            'take_profit': self.take_profit,
+            'current_price': self.current_price,
+            'unrealized_pnl': self.unrealized_pnl,
+            'order_id': self.order_id,
+            'reasons': list(self.reasons)
+        }
+
+class TradeHistory:
+    """Closed trades of this session stored column-wise so statistics are NumPy reductions"""
+    
+    def __init__(self, capacity: int = 1024):
+        self.pnl = np.empty(capacity, dtype=np.float64)
+        self.pnl_pct = np.empty(capacity, dtype=np.float64)
+        self.duration = np.empty(capacity, dtype=np.int32)  # minutes
+        self.symbol: List[str] = []
+        self.exit_reason: List[str] = []
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def _grow(self):
+        """Double the capacity of the numeric columns"""
+        capacity = 2 * len(self.pnl)
+        for name in ('pnl', 'pnl_pct', 'duration'):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            setattr(self, name, grown)
+    
+    def append(self, symbol: str, pnl: float, pnl_pct: float, duration: int, exit_reason: str):
+        """Record one closed trade"""
+        if self.count == len(self.pnl):
+            self._grow()
+        i = self.count
+        self.pnl[i] = pnl
+        self.pnl_pct[i] = pnl_pct
+        self.duration[i] = duration
+        self.symbol.append(symbol)
+        self.exit_reason.append(exit_reason)
+        self.count = i + 1
+    
+    def total_pnl(self) -> float:
+        """Sum of realized P&L"""
+        return float(self.pnl[:self.count].sum())
+    
+    def win_rate(self) -> float:
+        """Fraction of trades closed with positive P&L"""
+        return float((self.pnl[:self.count] > 0).mean()) if self.count else 0.0
 
 class EnhancedTradingBot:
     """Enhanced autonomous trading bot for AMD and SOL"""
     
+    # Trading universe
+    STOCK_SYMBOLS = ('AMD',)
+    CRYPTO_SYMBOLS = ('SOL/USD',)
+    ALL_SYMBOLS = STOCK_SYMBOLS + CRYPTO_SYMBOLS
+    
     def __init__(self):
         self.setup_logging()
         self.running = False
+        self._stop_event = threading.Event()
         self.status = BotStatus()
         
+        # Set before the components are built so shutdown() can tell what exists
+        self.alpaca_client = None
+        self.trading_logger = None
+        self.notification_manager = None
+        self._quote_pool = None
+        self._trade_log = None
+        
+        # Active trades are published as an immutable snapshot; writers swap in a
+        # new mapping under _trades_lock, readers just take the current reference
+        self._trades_lock = threading.RLock()
+        self._active_trades_snapshot: Mapping[str, ActiveTrade] = MappingProxyType({})
+        
+        # Exit levels of open trades laid out column-wise, one row per universe symbol,
+        # so stop/target checks are a single NumPy pass
+        self._sym_to_id = {symbol: i for i, symbol in enumerate(self.ALL_SYMBOLS)}
+        n_symbols = len(self.ALL_SYMBOLS)
+        self._open_mask = np.zeros(n_symbols, dtype=bool)
+        self._side = np.zeros(n_symbols, dtype=np.int8)
+        self._stop = np.zeros(n_symbols, dtype=np.float64)
+        self._target = np.zeros(n_symbols, dtype=np.float64)
+        self._price = np.zeros(n_symbols, dtype=np.float64)
+        self._market_hours_logged_key = None
+        self._last_status_hash = None
+        self._last_status_write = 0.0
+        self._bot_control_cache = None
+        self._insufficient_until: Dict[str, float] = {}  # symbol -> earliest retry after too few bars
+        self._status_ts_buf = (0, None)  # (epoch second, ISO string) for status timestamps
+        self._alt_data_cache: Dict[str, pd.DataFrame] = {}  # symbol -> yfinance daily bars
+        self._alt_data_ts = 0.0
+        self._account_cache = None
+        self._account_cache_ts = 0.0
+        self._account_ttl = 10.0
+        self._account_refresh = None  # Future of the in-flight background refresh
+        # (symbol, entry order id) of trades whose position was closed by a streamed fill
+        self._closed_fills: queue.Queue = queue.Queue()
+        self._bot_control_mtime = 0
+        
         try:
             # Initialize configuration
             self.config_manager = get_config()
@@ -71,17 +261,36 @@ class EnhancedTradingBot:
             if not self.config_manager.validate_config():
                 raise ValueError("Configuration validation failed")
             
+            # Exit price multipliers per asset class and side: (stop_loss, take_profit)
+            self._take_profit_pct = {
+                'stock': self.config.take_profit_percent,
+                'crypto': self.config.crypto_take_profit_percent
+            }
+            self._exit_mults = {}
+            for asset_class, sl_pct in (('stock', self.config.stop_loss_percent),
+                                        ('crypto', self.config.crypto_stop_loss_percent)):
+                tp_pct = self._take_profit_pct[asset_class]
+                self._exit_mults[asset_class] = {
+                    'long': (1 - sl_pct / 100, 1 + tp_pct / 100),
+                    'short': (1 + sl_pct / 100, 1 - tp_pct / 100)
+                }
+            
             # Initialize components
             self.alpaca_client = AlpacaClient(self.config_manager)
             self.technical_analyzer = TechnicalAnalyzer()
+            self._warmup_technical_analyzer()
             self.sentiment_analyzer = SimpleSentimentAnalyzer(self.config_manager)
             self.risk_manager = RiskManager(self.config_manager, self.alpaca_client)
             self.trading_logger = TradingLogger(self.config_manager)
             self.notification_manager = NotificationManager(self.config_manager)
             
+            # Overlaps the positions and quotes requests in monitor_positions and
+            # runs background account refreshes for update_status
+            self._quote_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='quotes')
+            
             # Bot state
-            self.active_trades: Dict[str, ActiveTrade] = {}
             self.last_scan_time = None
+            self.trade_history = TradeHistory()
             self.daily_stats = {
                 'trades_executed': 0,
                 'profit_loss': 0.0,
@@ -94,24 +303,125 @@ class EnhancedTradingBot:
             )
             self.ensure_data_dir()
             
+            # Append-only log of closed trades, one JSON record per line (O(1) per close)
+            self.trade_history_file = os.path.join(os.path.dirname(self.status_file), 'trade_history.jsonl')
+            self._trade_log = open(self.trade_history_file, 'ab', buffering=0)
+            
             self.logger.info("✅ Enhanced Trading Bot initialized successfully")
             
         except Exception as e:
             self.logger.error(f"❌ Bot initialization failed: {e}")
             raise
     
+    def _warmup_technical_analyzer(self):
+        """Run one analysis on synthetic bars so first-call costs are paid at startup.
+        
+        Any JIT-compiled indicator kernels (e.g. numba @njit(cache=True) with a no-op
+        fallback decorator) compile here rather than inside the first live scan.
+        """
+        try:
+            rng = np.random.default_rng(0)
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 100)))
+            df = pd.DataFrame({
+                'open': close * (1 + rng.normal(0, 0.002, 100)),
+                'high': close * 1.01,
+                'low': close * 0.99,
+                'close': close,
+                'volume': rng.integers(100_000, 1_000_000, 100).astype(float)
+            }, index=pd.date_range(end=datetime.now(), periods=100, freq='D'))
+            
+            start = time.perf_counter()
+            self.technical_analyzer.analyze_stock('WARMUP', df, self.config)
+            self.logger.debug("Technical analyzer warmup took %.1f ms", (time.perf_counter() - start) * 1000)
+        except Exception as e:
+            self.logger.debug("Technical analyzer warmup failed: %s", e)
+    
     def setup_logging(self):
         """Configure logging system"""
+        # Size-capped log file; records are buffered and written in batches,
+        # flushed immediately on ERROR and at exit
+        rotating_handler = logging.handlers.RotatingFileHandler(
+            'enhanced_bot.log', maxBytes=50 * 1024 * 1024, backupCount=5, encoding='utf-8'
+        )
+        rotating_handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        )
+        self._log_buffer = logging.handlers.MemoryHandler(
+            capacity=256, flushLevel=logging.ERROR, target=rotating_handler
+        )
+        atexit.register(self._log_buffer.flush)
+        
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler('enhanced_bot.log'),
+                self._log_buffer,
                 logging.StreamHandler(sys.stdout)
             ]
         )
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def active_trades(self) -> Mapping[str, ActiveTrade]:
+        """Current read-only snapshot of active trades (safe to iterate without locking)"""
+        return self._active_trades_snapshot
+    
+    def _set_active_trade(self, symbol: str, trade: ActiveTrade):
+        """Publish a new snapshot with symbol added or replaced"""
+        with self._trades_lock:
+            trades = dict(self._active_trades_snapshot)
+            trades[symbol] = trade
+            self._active_trades_snapshot = MappingProxyType(trades)
+            
+            i = self._sym_to_id.get(symbol)
+            if i is not None:
+                self._side[i] = 1 if trade.side == 'BUY' else -1
+                self._stop[i] = trade.stop_loss
+                self._target[i] = trade.take_profit
+                self._price[i] = trade.current_price
+                self._open_mask[i] = True
+    
+    def _update_active_trade(self, symbol: str, trade: ActiveTrade, **changes) -> Optional[ActiveTrade]:
+        """Publish a copy of trade with changes, unless it was closed or replaced meanwhile"""
+        with self._trades_lock:
+            if self._active_trades_snapshot.get(symbol) is not trade:
+                return None
+            updated = replace(trade, **changes)
+            self._set_active_trade(symbol, updated)
+            return updated
+    
+    def _remove_active_trade(self, symbol: str):
+        """Publish a new snapshot without symbol"""
+        with self._trades_lock:
+            trades = dict(self._active_trades_snapshot)
+            trades.pop(symbol, None)
+            self._active_trades_snapshot = MappingProxyType(trades)
+            
+            i = self._sym_to_id.get(symbol)
+            if i is not None:
+                self._open_mask[i] = False
+    
+    def _get_account_cached(self, force: bool = False):
+        """Account info, refreshed from Alpaca at most every _account_ttl seconds"""
+        now = time.monotonic()
+        if force or self._account_cache is None or now - self._account_cache_ts > self._account_ttl:
+            self._account_cache = self.alpaca_client.get_account()
+            self._account_cache_ts = now
+        return self._account_cache
+    
+    def _refresh_account_async(self):
+        """Refresh the account cache on the worker pool unless a refresh is already running"""
+        if self._account_refresh is not None and not self._account_refresh.done():
+            return
+        
+        def refresh():
+            try:
+                self._get_account_cached(force=True)
+            except Exception as e:
+                self.logger.warning(f"Background account refresh failed: {e}")
+        
+        self._account_refresh = self._quote_pool.submit(refresh)
+    
     def ensure_data_dir(self):
         """Ensure data directory exists"""
         data_dir = os.path.dirname(self.status_file)
@@ -120,65 +430,90 @@ class EnhancedTradingBot:
     def save_status(self):
         """Save bot status to file for dashboard"""
         try:
+            # orjson serializes ActiveTrade dataclasses and their datetimes natively
+            if orjson is not None:
+                active_trades = dict(self.active_trades)
+            else:
+                active_trades = {k: v.to_dict() for k, v in self.active_trades.items()}
+            
             status_data = {
-                'status': asdict(self.status),
-                'active_trades': {k: asdict(v) for k, v in self.active_trades.items()},
-                'daily_stats': self.daily_stats,
-                'timestamp': datetime.now().isoformat()
+                'status': self.status.to_dict(),
+                'active_trades': active_trades,
+                'daily_stats': self.daily_stats
             }
             
-            with open(self.status_file, 'w') as f:
-                json.dump(status_data, f, indent=2, default=str)
+            # Skip the write when nothing changed since the last one
+            encoded = self._encode_status(status_data)
+            status_hash = hashlib.blake2b(encoded, digest_size=16).digest()
+            now = time.monotonic()
+            if (status_hash == self._last_status_hash and
+                    now - self._last_status_write < STATUS_HEARTBEAT_SECONDS):
+                return
+            
+            status_data['timestamp'] = self._status_timestamp()
+            
+            # Write to a temp file and rename so readers never see a partial file
+            tmp_file = self.status_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(self._encode_status(status_data))
+            os.replace(tmp_file, self.status_file)
+            
+            self._last_status_hash = status_hash
+            self._last_status_write = now
                 
         except Exception as e:
             self.logger.error(f"Failed to save status: {e}")
     
+    def _status_timestamp(self) -> str:
+        """ISO timestamp for the status file, reformatted at most once per second"""
+        second = int(time.time())
+        if second != self._status_ts_buf[0]:
+            self._status_ts_buf = (second, datetime.fromtimestamp(second).isoformat())
+        return self._status_ts_buf[1]
+    
+    @staticmethod
+    def _encode_status(status_data: Dict) -> bytes:
+        """Serialize status data to compact JSON bytes"""
+        if orjson is not None:
+            return orjson.dumps(status_data, default=str,
+                                option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SORT_KEYS)
+        return json.dumps(status_data, sort_keys=True, default=str,
+                          separators=(',', ':')).encode('utf-8')
+    
     def load_bot_control(self) -> Dict:
-        """Load bot control settings from config"""
+        """Load bot control settings from config, re-reading the file only when it changes"""
+        default = {'enabled': True, 'scan_interval_seconds': 30}
         try:
-            return self.config_manager.config.get('bot_control', {
-                'enabled': True,
-                'scan_interval_seconds': 30
-            })
-        except:
-            return {'enabled': True, 'scan_interval_seconds': 30}
+            config_path = getattr(self.config_manager, 'config_path', None)
+            if config_path is None:
+                return self.config_manager.config.get('bot_control', default)
+            
+            mtime = os.stat(config_path).st_mtime_ns
+            if self._bot_control_cache is not None and mtime == self._bot_control_mtime:
+                return self._bot_control_cache
+            
+            # First call or the file changed on disk - pick up edited settings
+            if self._bot_control_cache is not None:
+                with open(config_path, 'r') as f:
+                    self.config_manager.config['bot_control'] = json.load(f).get('bot_control', default)
+            
+            self._bot_control_cache = self.config_manager.config.get('bot_control', default)
+            self._bot_control_mtime = mtime
+            return self._bot_control_cache
+        except Exception:
+            return default
     
     def is_market_hours_for_stocks(self) -> bool:
         """Check if current time is within stock market hours (premarket + regular)"""
         try:
-            # US Eastern timezone
-            et_tz = pytz.timezone('US/Eastern')
-            current_et = datetime.now(et_tz)
-            
-            weekday_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            current_weekday_name = weekday_names[current_et.weekday()]
+            current_et = datetime.now(_ET_TZ)
+            key = (current_et.date(), current_et.hour, current_et.minute)
+            is_market_open, message = _market_hours_decision(*key)
             
-            self.logger.info(f"🕐 Current ET time: {current_et.strftime('%A, %B %d, %Y at %I:%M:%S %p ET')}")
-            
-            # Skip weekends (Saturday=5, Sunday=6)
-            if current_et.weekday() >= 5:
-                self.logger.info(f"📅 Weekend detected ({current_weekday_name}) - stock market closed")
-                return False
-            
-            current_time = current_et.time()
-            
-            # Premarket: 4:00 AM - 9:30 AM ET
-            # Regular market: 9:30 AM - 4:00 PM ET
-            premarket_start = current_time.replace(hour=4, minute=0, second=0, microsecond=0)
-            market_close = current_time.replace(hour=16, minute=0, second=0, microsecond=0)
-            
-            is_market_open = premarket_start <= current_time <= market_close
-            
-            if is_market_open:
-                if current_time < current_time.replace(hour=9, minute=30):
-                    self.logger.info(f"🌅 Premarket hours ({current_weekday_name}) - AMD scanning enabled")
-                else:
-                    self.logger.info(f"🏢 Regular market hours ({current_weekday_name}) - AMD scanning enabled")
-            else:
-                if current_time < premarket_start:
-                    self.logger.info(f"🌙 Before premarket ({current_weekday_name}) - AMD scanning disabled")
-                else:
-                    self.logger.info(f"🌆 After market close ({current_weekday_name}) - AMD scanning disabled")
+            # Log the decision once per minute rather than on every call
+            if key != self._market_hours_logged_key:
+                self._market_hours_logged_key = key
+                self.logger.info(message)
             
             return is_market_open
             
@@ -190,6 +525,7 @@ class EnhancedTradingBot:
     def signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         self.logger.info(f"Received signal {signum}, shutting down gracefully...")
+        self._stop_event.set()
         self.shutdown()
     
     def start(self):
@@ -206,7 +542,7 @@ class EnhancedTradingBot:
             self.logger.info("🚀 Starting Enhanced Trading Bot (AMD + SOL)")
             
             # Initialize daily stats
-            account = self.alpaca_client.get_account()
+            account = self._get_account_cached()
             self.daily_stats['start_portfolio_value'] = account.portfolio_value
             
             # Send startup notification
@@ -215,6 +551,13 @@ class EnhancedTradingBot:
                 "SUCCESS"
             )
             
+            # Push fills instead of waiting for the next poll (falls back to polling if unavailable)
+            self.alpaca_client.start_trade_stream(self._on_trade_update)
+            
+            # Prime the alternative crypto data cache (and yfinance's HTTP session) off the main thread
+            if yf is not None:
+                self._quote_pool.submit(self._refresh_alt_data_batch, set(self.CRYPTO_SYMBOLS))
+            
             # Start main loop
             self.main_trading_loop()
             
@@ -225,46 +568,70 @@ class EnhancedTradingBot:
     
     def shutdown(self):
         """Shutdown bot gracefully"""
+        self.running = False
+        self._stop_event.set()
+        self.status.running = False
+        self.logger.info("🛑 Shutting down Enhanced Trading Bot")
+        
+        # Each cleanup step runs independently so one failure doesn't skip the rest
         try:
-            self.running = False
-            self.status.running = False
-            self.logger.info("🛑 Shutting down Enhanced Trading Bot")
-            
-            # Cancel all pending orders
-            if hasattr(self, 'alpaca_client'):
+            if self._quote_pool is not None:
+                self._quote_pool.shutdown(wait=False)
+        except Exception as e:
+            self.logger.error(f"Error stopping quote pool: {e}")
+        
+        # Cancel all pending orders
+        try:
+            if self.alpaca_client is not None:
+                self.alpaca_client.stop_trade_stream()
                 self.alpaca_client.cancel_all_orders()
-            
-            # Generate final performance report
-            if hasattr(self, 'trading_logger'):
+        except Exception as e:
+            self.logger.error(f"Error cancelling orders during shutdown: {e}")
+        
+        # Generate final performance report
+        try:
+            if self.trading_logger is not None:
                 report = self.trading_logger.generate_performance_report()
                 self.logger.info("📊 Final performance report generated")
-            
-            # Log daily summary
-            account = self.alpaca_client.get_account()
-            daily_pnl = account.portfolio_value - self.daily_stats['start_portfolio_value']
-            
-            summary = f"""Daily Summary:
+        except Exception as e:
+            self.logger.error(f"Error generating final performance report: {e}")
+        
+        # Log daily summary and send shutdown notification
+        try:
+            if self.alpaca_client is not None:
+                account = self._get_account_cached(force=True)
+                daily_pnl = account.portfolio_value - self.daily_stats['start_portfolio_value']
+                
+                summary = f"""Daily Summary:
 Trades: {self.daily_stats['trades_executed']}
 P&L: ${daily_pnl:.2f}
 Portfolio: ${account.portfolio_value:.2f}"""
-            
-            self.logger.info(f"📈 {summary}")
-            
-            # Send shutdown notification
-            self.notification_manager.send_system_alert(summary, "INFO")
-            
-            # Save final status
+                
+                self.logger.info(f"📈 {summary}")
+                
+                if self.notification_manager is not None:
+                    self.notification_manager.send_system_alert(summary, "INFO")
+        except Exception as e:
+            self.logger.error(f"Error sending daily summary: {e}")
+        
+        # Save final status
+        try:
             self.save_status()
-            
         except Exception as e:
-            self.logger.error(f"Error during shutdown: {e}")
+            self.logger.error(f"Error saving final status: {e}")
+        
+        try:
+            if self._trade_log is not None:
+                self._trade_log.close()
+        except Exception as e:
+            self.logger.error(f"Error closing trade history file: {e}")
         
-        finally:
-            self.logger.info("✅ Bot shutdown complete")
+        self.logger.info("✅ Bot shutdown complete")
+        self._log_buffer.flush()
     
     def main_trading_loop(self):
         """Enhanced main trading loop"""
-        while self.running:
+        while not self._stop_event.is_set():
             try:
                 # Load current bot control settings
                 bot_control = self.load_bot_control()
@@ -273,7 +640,8 @@ Portfolio: ${account.portfolio_value:.2f}"""
                 # Check if bot is enabled
                 if not bot_control.get('enabled', True):
                     self.status.enabled = False
-                    time.sleep(10)
+                    if self._stop_event.wait(10):
+                        break
                     continue
                 
                 self.status.enabled = True
@@ -288,28 +656,30 @@ Portfolio: ${account.portfolio_value:.2f}"""
                     
                     self.scan_for_opportunities()
                     self.last_scan_time = current_time
-                    self.status.last_scan = datetime.now().isoformat()
+                    self.status.last_scan_epoch = time.time_ns()
                     self.status.scan_count += 1
                 
                 # Update and save status
                 self.update_status()
                 self.save_status()
                 
-                # Brief pause
-                time.sleep(5)
+                # Brief pause (returns early on shutdown)
+                if self._stop_event.wait(5):
+                    break
                 
             except Exception as e:
                 self.logger.error(f"❌ Error in main loop: {e}")
                 self.status.error_count += 1
                 self.notification_manager.send_system_alert(f"Bot error: {e}", "ERROR")
-                time.sleep(30)  # Wait before retrying
+                if self._stop_event.wait(30):  # Wait before retrying
+                    break
     
     def scan_for_opportunities(self):
         """Enhanced opportunity scanning"""
         try:
             self.logger.info("🔍 Scanning AMD & SOL for opportunities...")
             
-            account = self.alpaca_client.get_account()
+            account = self._get_account_cached()
             
             # Check if we can make new trades
             if len(self.active_trades) >= self.config.max_positions:
@@ -319,17 +689,12 @@ Portfolio: ${account.portfolio_value:.2f}"""
             # Check market hours for stock scanning
             is_market_open = self.is_market_hours_for_stocks()
             
-            # Scan each symbol with market hours consideration
-            symbols_to_scan = []
-            
-            # AMD - only during market hours (premarket + regular)
+            # Stocks only during market hours (premarket + regular), crypto 24/7
             if is_market_open:
-                symbols_to_scan.append('AMD')
+                symbols_to_scan = self.ALL_SYMBOLS
             else:
-                self.logger.info("⏰ Market closed - skipping AMD (stocks only trade during market hours)")
-            
-            # SOL - always (crypto trades 24/7)
-            symbols_to_scan.append('SOL/USD')
+                symbols_to_scan = self.CRYPTO_SYMBOLS
+                self.logger.debug("⏰ Market closed - skipping stocks (stocks only trade during market hours)")
             
             if not symbols_to_scan:
                 self.logger.info("⏭️ No symbols to scan at this time")
@@ -356,64 +721,75 @@ Portfolio: ${account.portfolio_value:.2f}"""
     def analyze_symbol(self, symbol: str, account) -> Optional[Dict]:
         """Comprehensive symbol analysis"""
         try:
-            self.logger.info(f"📊 Analyzing {symbol}...")
+            # Still warming up - don't refetch bars until the backoff expires
+            if time.time() < self._insufficient_until.get(symbol, 0):
+                self.logger.debug("⏳ %s: waiting for more bar history", symbol)
+                return None
+            
+            self.logger.debug("📊 Analyzing %s...", symbol)
             
             # Technical analysis  
-            self.logger.info(f"    💾 Requesting 100 daily bars for {symbol}...")
+            self.logger.debug("    💾 Requesting 100 daily bars for %s...", symbol)
             df = self.alpaca_client.get_bars(symbol, timeframe='1Day', limit=100)
             
             if df is None:
-                self.logger.warning(f"⚠️ get_bars returned None for {symbol}")
+                self.logger.warning("⚠️ get_bars returned None for %s", symbol)
                 return None
                 
             if df.empty:
-                self.logger.warning(f"⚠️ get_bars returned empty DataFrame for {symbol}")
+                self.logger.warning("⚠️ get_bars returned empty DataFrame for %s", symbol)
                 return None
             
-            self.logger.info(f"    📈 Retrieved {len(df)} bars for {symbol}, latest price: ${df['close'].iloc[-1]:.2f}")
-            self.logger.info(f"    🗺 Date range: {df.index[0]} to {df.index[-1]}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("    📈 Retrieved %d bars for %s, latest price: $%.2f",
+                                  len(df), symbol, df['close'].iloc[-1])
+                self.logger.debug("    🗺 Date range: %s to %s", df.index[0], df.index[-1])
             
             if len(df) < 10:  # Reduced requirement for testing
-                self.logger.warning(f"    ⚠️ Insufficient data for {symbol}: {len(df)} bars < 10 required")
+                self.logger.warning("    ⚠️ Insufficient data for %s: %d bars < 10 required", symbol, len(df))
                 
                 # Try alternative data source for crypto
                 if '/' in symbol:
-                    self.logger.info(f"    🔄 Trying alternative data source for {symbol}...")
+                    self.logger.info("    🔄 Trying alternative data source for %s...", symbol)
                     df_alt = self.get_alternative_crypto_data(symbol)
                     if df_alt is not None and len(df_alt) >= 10:
                         df = df_alt
-                        self.logger.info(f"    ✅ Alternative data retrieved: {len(df)} bars")
+                        self.logger.info("    ✅ Alternative data retrieved: %d bars", len(df))
                     else:
+                        self._insufficient_until[symbol] = time.time() + INSUFFICIENT_DATA_BACKOFF
                         return None
                 else:
+                    self._insufficient_until[symbol] = time.time() + INSUFFICIENT_DATA_BACKOFF
                     return None
             
-            self.logger.info(f"    📋 Config type: {type(self.config)}, has momentum_lookback: {hasattr(self.config, 'momentum_lookback')}")
+            self._insufficient_until.pop(symbol, None)
             
             technical_signal = self.technical_analyzer.analyze_stock(symbol, df, self.config)
             
-            if technical_signal is None:
-                self.logger.info(f"    ⚠️ Technical analyzer returned None for {symbol}")
-            
             if not technical_signal:
-                self.logger.info(f"📊 {symbol}: ❌ No technical signal generated (insufficient data or calculation error)")
+                self.logger.info("📊 %s: ❌ No technical signal generated (insufficient data or calculation error)", symbol)
                 return None
                 
             if technical_signal.confidence < 0.35:  # Lowered for testing
-                self.logger.info(f"📊 {symbol}: ❌ Low technical confidence ({technical_signal.confidence:.2f} < 0.35 required)")
-                self.logger.info(f"    📈 Price: ${technical_signal.price:.2f}")
-                self.logger.info(f"    📊 Signal: {technical_signal.signal_type}")
-                self.logger.info(f"    🎯 RSI: {technical_signal.rsi_value:.1f}" if technical_signal.rsi_value else "    🎯 RSI: N/A")
-                self.logger.info(f"    💡 Reasons: {', '.join(technical_signal.reasons) if technical_signal.reasons else 'No specific reasons'}")
+                self.logger.info("📊 %s: ❌ Low technical confidence (%.2f < 0.35 required)",
+                                 symbol, technical_signal.confidence)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("    📈 Price: $%.2f", technical_signal.price)
+                    self.logger.debug("    📊 Signal: %s", technical_signal.signal_type)
+                    self.logger.debug("    🎯 RSI: %s", f"{technical_signal.rsi_value:.1f}" if technical_signal.rsi_value else "N/A")
+                    self.logger.debug("    💡 Reasons: %s", ', '.join(technical_signal.reasons) if technical_signal.reasons else 'No specific reasons')
                 return None
             
             # Advanced sentiment analysis
-            self.logger.info(f"    🔍 Running sentiment analysis for {symbol}...")
+            self.logger.debug("    🔍 Running sentiment analysis for %s...", symbol)
             sentiment_analysis = self.sentiment_analyzer.analyze_symbol_sentiment(symbol)
             
-            self.logger.info(f"    💭 Sentiment: {sentiment_analysis.get('recommendation', 'UNKNOWN')} (score: {sentiment_analysis.get('sentiment_score', 0):.2f})")
-            self.logger.info(f"    ⚠️ Risk Level: {sentiment_analysis.get('risk_level', 'UNKNOWN')}")
-            self.logger.info(f"    📰 News Articles: {sentiment_analysis.get('news_count', 0)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("    💭 Sentiment: %s (score: %.2f)",
+                                  sentiment_analysis.get('recommendation', 'UNKNOWN'),
+                                  sentiment_analysis.get('sentiment_score', 0))
+                self.logger.debug("    ⚠️ Risk Level: %s", sentiment_analysis.get('risk_level', 'UNKNOWN'))
+                self.logger.debug("    📰 News Articles: %s", sentiment_analysis.get('news_count', 0))
             
             # Combine analyses
             combined_analysis = self.combine_analyses(
@@ -422,9 +798,11 @@ Portfolio: ${account.portfolio_value:.2f}"""
             
             if not combined_analysis.get('should_trade', False):
                 reason = combined_analysis.get('reason', 'Unknown reason')
-                self.logger.info(f"    ❌ Trade skipped: {reason}")
+                self.logger.info("    ❌ %s trade skipped: %s", symbol, reason)
             else:
-                self.logger.info(f"    ✅ Trade signal generated: {combined_analysis.get('direction')} with {combined_analysis.get('confidence', 0):.2f} confidence")
+                self.logger.info("    ✅ %s trade signal generated: %s with %.2f confidence",
+                                 symbol, combined_analysis.get('direction'),
+                                 combined_analysis.get('confidence', 0))
             
             return combined_analysis
             
@@ -448,30 +826,17 @@ Portfolio: ${account.portfolio_value:.2f}"""
             sentiment_direction = sentiment_analysis.get('momentum_direction', 'NEUTRAL')
             
             # Enhanced decision logic with detailed logging
-            self.logger.info(f"    🧮 Decision Logic for {symbol}:")
-            self.logger.info(f"        Technical: {tech_signal_type}")
-            self.logger.info(f"        Sentiment Rec: {sentiment_rec}")
-            self.logger.info(f"        Sentiment Direction: {sentiment_direction}")
-            
-            if (tech_signal_type == SignalType.BUY and 
-                sentiment_rec in ['STRONG_BUY', 'BUY'] and
-                sentiment_direction in ['BULLISH', 'NEUTRAL']):
-                
-                trade_direction = 'BUY'
-                
-            elif (tech_signal_type == SignalType.SELL and 
-                  sentiment_rec in ['STRONG_SELL', 'SELL'] and
-                  sentiment_direction in ['BEARISH', 'NEUTRAL']):
-                
-                trade_direction = 'SELL'
-                
-            else:
+            self.logger.debug("    🧮 Decision Logic for %s: Technical: %s, Sentiment Rec: %s, Sentiment Direction: %s",
+                              symbol, tech_signal_type, sentiment_rec, sentiment_direction)
+            
+            trade_direction = _DECISION_TABLE.get((tech_signal_type, sentiment_rec, sentiment_direction))
+            if trade_direction is None:
                 conflict_reason = f"Tech: {tech_signal_type}, Sentiment: {sentiment_rec} ({sentiment_direction})"
                 return {'should_trade': False, 'reason': f'Conflicting signals - {conflict_reason}'}
             
             # Calculate position size using full balance approach
             balance_to_use = account.buying_power * (self.config.capital_use_percentage / 100)
-            position_value = balance_to_use / (len(['AMD', 'SOL/USD']) - len(self.active_trades))
+            position_value = balance_to_use / (len(self.ALL_SYMBOLS) - len(self.active_trades))
             
             if '/' in symbol:  # Crypto - fractional shares
                 quantity = position_value / current_price
@@ -481,20 +846,15 @@ Portfolio: ${account.portfolio_value:.2f}"""
             if quantity <= 0:
                 return {'should_trade': False, 'reason': f'Insufficient funds (calculated quantity: {quantity}, balance: ${balance_to_use:.2f})'}
             
-            # Calculate stop-loss and take-profit
-            is_crypto = '/' in symbol
-            stop_loss_pct = self.config.crypto_stop_loss_percent if is_crypto else self.config.stop_loss_percent
-            take_profit_pct = self.config.crypto_take_profit_percent if is_crypto else self.config.take_profit_percent
+            # Stop-loss / take-profit from the precomputed multipliers
+            asset_class = 'crypto' if '/' in symbol else 'stock'
+            side = 'long' if trade_direction == 'BUY' else 'short'
+            sl_mult, tp_mult = self._exit_mults[asset_class][side]
+            stop_loss = current_price * sl_mult
+            take_profit = current_price * tp_mult
             
-            if trade_direction == 'BUY':
-                stop_loss = current_price * (1 - stop_loss_pct / 100)
-                take_profit = current_price * (1 + take_profit_pct / 100)
-            else:
-                stop_loss = current_price * (1 + stop_loss_pct / 100)
-                take_profit = current_price * (1 - take_profit_pct / 100)
-            
-            # Calculate estimated ROI
-            estimated_roi = take_profit_pct if trade_direction == 'BUY' else take_profit_pct
+            # Estimated ROI is the take-profit distance, positive for either side
+            estimated_roi = self._take_profit_pct[asset_class]
             
             # Compile reasons
             reasons = technical_signal.reasons.copy()
@@ -533,11 +893,11 @@ Portfolio: ${account.portfolio_value:.2f}"""
             stop_loss = signal['stop_loss']
             take_profit = signal['take_profit']
             
-            self.logger.info(f"🎯 Executing {direction} for {symbol}")
-            self.logger.info(f"   Quantity: {quantity}")
-            self.logger.info(f"   Price: ${current_price:.2f}")
-            self.logger.info(f"   Stop Loss: ${stop_loss:.2f}")
-            self.logger.info(f"   Take Profit: ${take_profit:.2f}")
+            self.logger.info("🎯 Executing %s for %s", direction, symbol)
+            self.logger.info("   Quantity: %s", quantity)
+            self.logger.info("   Price: $%.2f", current_price)
+            self.logger.info("   Stop Loss: $%.2f", stop_loss)
+            self.logger.info("   Take Profit: $%.2f", take_profit)
             
             # Place order
             order_side = OrderSide.BUY if direction == 'BUY' else OrderSide.SELL
@@ -549,8 +909,11 @@ Portfolio: ${account.portfolio_value:.2f}"""
             )
             
             if order_id:
+                # Buying power changed - next sizing must see fresh account data
+                self._account_cache_ts = 0.0
+                
                 # Track active trade
-                self.active_trades[symbol] = ActiveTrade(
+                self._set_active_trade(symbol, ActiveTrade(
                     symbol=symbol,
                     side=direction,
                     quantity=quantity,
@@ -562,7 +925,7 @@ Portfolio: ${account.portfolio_value:.2f}"""
                     unrealized_pnl=0.0,
                     order_id=order_id,
                     reasons=signal['reasons']
-                )
+                ))
                 
                 self.daily_stats['trades_executed'] += 1
                 
@@ -578,53 +941,140 @@ Portfolio: ${account.portfolio_value:.2f}"""
                     'reason': ', '.join(signal['reasons'][:2])  # Limit for SMS
                 })
                 
-                self.logger.info(f"✅ Trade executed: {order_id}")
+                self.logger.info("✅ Trade executed: %s", order_id)
                 
             else:
-                self.logger.error(f"❌ Failed to place order for {symbol}")
+                self.logger.error("❌ Failed to place order for %s", symbol)
+                
+        except Exception as e:
+            self.logger.error("Trade execution failed for %s: %s", symbol, e)
+    
+    async def _on_trade_update(self, data):
+        """Trade updates stream handler (runs on the stream thread)"""
+        try:
+            if data.event not in ('fill', 'partial_fill'):
+                return
+            
+            # Fills move cash and positions - refresh the account without waiting for the TTL
+            self._refresh_account_async()
+            
+            order = data.order
+            trade = self.active_trades.get(order.symbol)
+            if trade is None:
+                return
+            
+            if str(order.id) == trade.order_id:
+                # Entry fill - track the real fill price instead of the signal price
+                if order.filled_avg_price:
+                    self._update_active_trade(order.symbol, trade, entry_price=float(order.filled_avg_price))
+            elif data.event == 'fill' and self._is_flat_after_fill(data, trade):
+                self._closed_fills.put((order.symbol, trade.order_id))
                 
         except Exception as e:
-            self.logger.error(f"Trade execution failed for {symbol}: {e}")
+            self.logger.warning("Error handling trade update: %s", e)
+    
+    def _is_flat_after_fill(self, data, trade: ActiveTrade) -> bool:
+        """Whether a non-entry fill left the trade's position fully closed"""
+        # Only an order on the opposite side of the trade can reduce the position
+        order_side = str(getattr(data.order.side, 'value', data.order.side)).upper()
+        if order_side == trade.side:
+            return False
+        
+        # The stream reports the resulting position size on fills; fall back to asking the API
+        position_qty = getattr(data, 'position_qty', None)
+        if position_qty is not None:
+            return float(position_qty) == 0
+        return self.alpaca_client.get_open_position(data.order.symbol) is None
+    
+    def _drain_closed_fills(self):
+        """Stop tracking trades whose positions the trade stream reported as closed"""
+        while True:
+            try:
+                symbol, order_id = self._closed_fills.get_nowait()
+            except queue.Empty:
+                return
+            trade = self.active_trades.get(symbol)
+            # Ignore fills for a trade that was already closed and replaced
+            if trade is not None and trade.order_id == order_id:
+                self.logger.info("📊 Position %s closed by a filled order - removing from tracking", symbol)
+                self._remove_active_trade(symbol)
     
     def monitor_positions(self):
         """Monitor active positions for exit conditions"""
         try:
+            self._drain_closed_fills()
             if not self.active_trades:
                 return
                 
-            positions = self.alpaca_client.get_positions()
+            # Fetch positions and all quotes concurrently (one batched quote request)
+            positions_future = self._quote_pool.submit(
+                self.alpaca_client.get_positions_for, list(self.active_trades))
+            quotes_future = self._quote_pool.submit(
+                self.alpaca_client.get_latest_quotes, list(self.active_trades))
+            
+            positions = positions_future.result(timeout=10)
             position_dict = {pos.symbol: pos for pos in positions}
+            try:
+                quotes = quotes_future.result(timeout=10)
+            except Exception as e:
+                self.logger.warning("Batch quote fetch failed: %s", e)
+                quotes = {}
+            
+            # One clock read for every position checked this tick
+            now = datetime.now()
+            trades = self.active_trades
             
-            for symbol, trade in list(self.active_trades.items()):
+            # Pass 1: drop vanished positions and refresh prices
+            for symbol, trade in trades.items():
                 try:
                     # Check if position still exists
                     if symbol not in position_dict:
-                        self.logger.info(f"📊 Position {symbol} no longer exists - removing from tracking")
-                        del self.active_trades[symbol]
+                        self.logger.info("📊 Position %s no longer exists - removing from tracking", symbol)
+                        self._remove_active_trade(symbol)
                         continue
                     
                     position = position_dict[symbol]
                     
                     # Update current price and P&L
-                    quote = self.alpaca_client.get_latest_quote(symbol)
+                    quote = quotes.get(symbol)
                     if quote:
-                        trade.current_price = (quote['bid'] + quote['ask']) / 2
-                        trade.unrealized_pnl = position.unrealized_pl
-                    
-                    # Check exit conditions
-                    should_exit, exit_reason = self.should_exit_position(trade)
+                        self._update_active_trade(symbol, trade,
+                                                  current_price=(quote['bid'] + quote['ask']) / 2,
+                                                  unrealized_pnl=position.unrealized_pl)
+                        
+                except Exception as e:
+                    self.logger.error("Error monitoring position %s: %s", symbol, e)
+            
+            # Stop-loss / take-profit for every open position in one vectorized pass;
+            # side is +1 long / -1 short so both directions share the comparisons
+            stop_hits = self._open_mask & (self._side * (self._price - self._stop) <= 0)
+            target_hits = self._open_mask & (self._side * (self._price - self._target) >= 0)
+            
+            # Pass 2: exit checks
+            for symbol, trade in self.active_trades.items():
+                try:
+                    i = self._sym_to_id.get(symbol)
+                    if i is None:
+                        should_exit, exit_reason = self.should_exit_position(trade, now)
+                    elif stop_hits[i]:
+                        should_exit, exit_reason = True, "Stop loss triggered"
+                    elif target_hits[i]:
+                        should_exit, exit_reason = True, "Take profit triggered"
+                    else:
+                        should_exit = now - trade.entry_time > MAX_HOLD_TIME
+                        exit_reason = "Maximum hold time reached"
                     
                     if should_exit:
-                        self.close_position(symbol, trade, exit_reason)
+                        self.close_position(symbol, trade, exit_reason, now)
                         
                 except Exception as e:
-                    self.logger.error(f"Error monitoring position {symbol}: {e}")
+                    self.logger.error("Error monitoring position %s: %s", symbol, e)
                     continue
                     
         except Exception as e:
-            self.logger.error(f"Position monitoring error: {e}")
+            self.logger.error("Position monitoring error: %s", e)
     
-    def should_exit_position(self, trade: ActiveTrade) -> tuple[bool, str]:
+    def should_exit_position(self, trade: ActiveTrade, now: Optional[datetime] = None) -> tuple[bool, str]:
         """Determine if position should be exited"""
         try:
             current_price = trade.current_price
@@ -643,121 +1093,260 @@ Portfolio: ${account.portfolio_value:.2f}"""
                     return True, "Take profit triggered"
             
             # Time-based exit (optional)
-            hours_held = (datetime.now() - trade.entry_time).total_seconds() / 3600
-            if hours_held > 24:  # 24 hour max hold
+            if (now or datetime.now()) - trade.entry_time > MAX_HOLD_TIME:
                 return True, "Maximum hold time reached"
                 
             return False, "Continue holding"
             
         except Exception as e:
-            self.logger.error(f"Exit condition check failed: {e}")
+            self.logger.error("Exit condition check failed: %s", e)
             return False, "Error checking exit conditions"
     
-    def close_position(self, symbol: str, trade: ActiveTrade, reason: str):
+    def close_position(self, symbol: str, trade: ActiveTrade, reason: str, now: Optional[datetime] = None):
         """Close position and log results"""
+        self.logger.info("🔄 Closing %s: %s", symbol, reason)
+        
+        # Close position
         try:
-            self.logger.info(f"🔄 Closing {symbol}: {reason}")
-            
-            # Close position
             close_order_id = self.alpaca_client.close_position(symbol)
-            
-            if close_order_id:
-                # Calculate final P&L
-                exit_price = trade.current_price
-                pnl = trade.unrealized_pnl
-                pnl_percent = ((exit_price - trade.entry_price) / trade.entry_price) * 100
-                duration = (datetime.now() - trade.entry_time).total_seconds() / 60
-                
-                if trade.side == 'SELL':  # Short position
-                    pnl_percent = -pnl_percent
-                
-                # Log trade
-                trade_data = {
-                    'symbol': symbol,
-                    'action': 'SELL' if trade.side == 'BUY' else 'BUY',
-                    'quantity': trade.quantity,
-                    'entry_price': trade.entry_price,
-                    'exit_price': exit_price,
-                    'pnl': pnl,
-                    'pnl_percent': pnl_percent,
-                    'exit_reason': reason,
-                    'duration_minutes': int(duration),
-                    'strategy_signals': ', '.join(trade.reasons),
-                    'confidence': 0.8,  # Would get from stored data
-                    'fees': 0.0
-                }
-                
-                self.trading_logger.log_trade(trade_data)
-                
-                # Send SMS notification
-                self.notification_manager.send_trade_exit_alert({
-                    'symbol': symbol,
-                    'original_action': trade.side,
-                    'entry_price': trade.entry_price,
-                    'exit_price': exit_price,
-                    'quantity': trade.quantity,
-                    'pnl': pnl,
-                    'pnl_percent': pnl_percent,
-                    'exit_reason': reason,
-                    'duration_minutes': int(duration)
-                })
-                
-                # Update daily stats
-                self.daily_stats['profit_loss'] += pnl
-                
-                # Remove from active trades
-                del self.active_trades[symbol]
-                
-                self.logger.info(f"✅ Position closed: {symbol} P&L: ${pnl:.2f} ({pnl_percent:.1f}%)")
-                
         except Exception as e:
-            self.logger.error(f"Error closing position {symbol}: {e}")
+            self.logger.error("Error closing position %s: %s", symbol, e, exc_info=True)
+            return
+        
+        if not close_order_id:
+            return
+        
+        # Calculate final P&L (dollar P&L comes from the broker's unrealized P&L)
+        exit_price = trade.current_price
+        pnl = trade.unrealized_pnl
+        pnl_percent, duration = compute_close_metrics(
+            trade.entry_price, exit_price,
+            SIDE_SHORT if trade.side == 'SELL' else SIDE_LONG,
+            int(trade.entry_time.timestamp() * 1e9),
+            int((now or datetime.now()).timestamp() * 1e9)
+        )
+        
+        # Update daily stats and stop tracking before the log/notification I/O,
+        # so a failure there can't leave a closed position tracked
+        self.trade_history.append(symbol, pnl, pnl_percent, int(duration), reason)
+        self.daily_stats['profit_loss'] = self.trade_history.total_pnl()
+        self._remove_active_trade(symbol)
+        
+        # Log trade
+        trade_data = {
+            'symbol': symbol,
+            'action': 'SELL' if trade.side == 'BUY' else 'BUY',
+            'quantity': trade.quantity,
+            'entry_price': trade.entry_price,
+            'exit_price': exit_price,
+            'pnl': pnl,
+            'pnl_percent': pnl_percent,
+            'exit_reason': reason,
+            'duration_minutes': int(duration),
+            'strategy_signals': ', '.join(trade.reasons),
+            'confidence': 0.8,  # Would get from stored data
+            'fees': 0.0
+        }
+        try:
+            self.trading_logger.log_trade(trade_data)
+        except Exception as e:
+            self.logger.error("Error logging closed trade %s: %s", symbol, e, exc_info=True)
+        
+        try:
+            self._append_trade_history({
+                **trade_data,
+                'entry_time': trade.entry_time.isoformat(),
+                'exit_time': (now or datetime.now()).isoformat()
+            })
+        except Exception as e:
+            self.logger.error("Error appending trade history for %s: %s", symbol, e, exc_info=True)
+        
+        # Send SMS notification
+        try:
+            self.notification_manager.send_trade_exit_alert({
+                'symbol': symbol,
+                'original_action': trade.side,
+                'entry_price': trade.entry_price,
+                'exit_price': exit_price,
+                'quantity': trade.quantity,
+                'pnl': pnl,
+                'pnl_percent': pnl_percent,
+                'exit_reason': reason,
+                'duration_minutes': int(duration)
+            })
+        except Exception as e:
+            self.logger.error("Error sending exit alert for %s: %s", symbol, e, exc_info=True)
+        
+        self.logger.info("✅ Position closed: %s P&L: $%.2f (%.1f%%)", symbol, pnl, pnl_percent)
+    
+    def _append_trade_history(self, record: Dict):
+        """Append one closed-trade record to trade_history.jsonl with a single write"""
+        if orjson is not None:
+            line = orjson.dumps(record, default=str) + b'\n'
+        else:
+            line = (json.dumps(record, default=str, separators=(',', ':')) + '\n').encode('utf-8')
+        self._trade_log.write(line)
+    
+    @staticmethod
+    def load_trade_history(path: str) -> pd.DataFrame:
+        """Load a trade_history.jsonl file for analysis"""
+        try:
+            return pd.read_json(path, lines=True)
+        except (FileNotFoundError, ValueError):
+            return pd.DataFrame()
     
     def get_alternative_crypto_data(self, symbol: str):
-        """Get crypto data from alternative source (yfinance)"""
+        """Get crypto data from alternative source (yfinance), cached in memory and on disk"""
+        if symbol not in self._alt_data_cache or time.monotonic() - self._alt_data_ts >= YF_CACHE_TTL:
+            # Refresh every crypto symbol together so they share one download
+            self._refresh_alt_data_batch(set(self.CRYPTO_SYMBOLS) | {symbol})
+        return self._alt_data_cache.get(symbol)
+    
+    def _refresh_alt_data_batch(self, symbols):
+        """Load alternative data for symbols from the disk cache, downloading stale ones in one batch"""
+        # Convert symbol format: SOL/USD -> SOL-USD
+        yf_symbols = {symbol: symbol.replace('/', '-') for symbol in symbols}
+        paths = {symbol: os.path.join(_YF_CACHE_DIR, f"{yf_sym}_6mo_1d.pkl")
+                 for symbol, yf_sym in yf_symbols.items()}
+        
+        cached = {}
+        
+        def load_fresh():
+            stale = []
+            for symbol, path in paths.items():
+                df = self._read_yf_cache(path)
+                if df is not None:
+                    self._alt_data_cache[symbol] = cached[symbol] = df
+                if df is None or time.time() - os.stat(path).st_mtime >= YF_CACHE_TTL:
+                    stale.append(symbol)
+            return stale
+        
         try:
-            import yfinance as yf
+            stale = load_fresh()
+            if stale:
+                os.makedirs(_YF_CACHE_DIR, exist_ok=True)
+                # Serialize refreshes across threads/processes (where flock exists; the
+                # os.replace writes stay atomic without it, at worst duplicating a download)
+                with open(os.path.join(_YF_CACHE_DIR, '.lock'), 'w') as lock_file:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    try:
+                        # Another writer may have refreshed them while we waited
+                        stale = load_fresh()
+                        if stale:
+                            # Symbols with history only need the last few bars appended;
+                            # the rest get a full 6-month download
+                            incremental = [s for s in stale if s in cached and not cached[s].empty]
+                            full = [s for s in stale if s not in incremental]
+                            frames = {}
+                            if incremental:
+                                start = min(cached[s].index[-1] for s in incremental) - pd.Timedelta(days=3)
+                                frames.update(self._fetch_yf_batch(
+                                    [yf_symbols[s] for s in incremental], start=start.strftime('%Y-%m-%d')))
+                            if full:
+                                frames.update(self._fetch_yf_batch([yf_symbols[s] for s in full]))
+                            
+                            for symbol in stale:
+                                df = frames.get(yf_symbols[symbol])
+                                if df is None:
+                                    continue
+                                if symbol in incremental:
+                                    df = self._merge_alt_history(cached[symbol], df)
+                                tmp_path = paths[symbol] + '.tmp'
+                                df.to_pickle(tmp_path)
+                                os.replace(tmp_path, paths[symbol])
+                                self._alt_data_cache[symbol] = df
+                    finally:
+                        if fcntl is not None:
+                            fcntl.flock(lock_file, fcntl.LOCK_UN)
             
-            # Convert symbol format: SOL/USD -> SOL-USD
-            yf_symbol = symbol.replace('/', '-')
-            
-            self.logger.info(f"    🔍 Fetching {yf_symbol} from yfinance...")
-            
-            ticker = yf.Ticker(yf_symbol)
-            hist = ticker.history(period="6mo", interval="1d")
+        except Exception as e:
+            # Stale cache (already loaded above) beats no data when yfinance is down
+            self.logger.warning("Alternative data fetch failed for %s: %s", ', '.join(symbols), e)
+        
+        self._alt_data_ts = time.monotonic()
+    
+    @staticmethod
+    def _merge_alt_history(cached: pd.DataFrame, tail: pd.DataFrame) -> pd.DataFrame:
+        """Append freshly downloaded bars to cached history, keeping the newest copy of each bar and 6 months total"""
+        if tail.index.tz != cached.index.tz and tail.index.tz is not None:
+            tail = tail.tz_convert(cached.index.tz) if cached.index.tz is not None else tail.tz_localize(None)
+        df = pd.concat([cached, tail])
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+        return df[df.index >= df.index[-1] - pd.DateOffset(months=6)]
+    
+    def _fetch_yf_batch(self, yf_symbols: List[str], start: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Download daily bars for all symbols in one yfinance request (6 months, or from start)"""
+        if yf is None:
+            self.logger.warning("yfinance not installed - no alternative data for %s", ', '.join(yf_symbols))
+            return {}
+        
+        self.logger.info("    🔍 Fetching %s from yfinance...", ', '.join(yf_symbols))
+        
+        window = {'start': start} if start else {'period': '6mo'}
+        data = yf.download(yf_symbols, interval="1d", group_by='ticker',
+                           threads=True, progress=False, **window)
+        
+        frames = {}
+        if data is None or data.empty:
+            return frames
+        
+        for yf_symbol in yf_symbols:
+            if isinstance(data.columns, pd.MultiIndex):
+                if yf_symbol not in data.columns.get_level_values(0):
+                    continue
+                hist = data.xs(yf_symbol, axis=1, level=0)
+            else:
+                hist = data
             
+            # Rows are aligned across tickers; drop the ones this ticker has no bar for
+            hist = hist.dropna(how='all')
             if hist.empty:
-                return None
+                continue
             
-            # Convert to match Alpaca format
-            df = hist.copy()
-            df.columns = [col.lower() for col in df.columns]
-            df = df.rename(columns={'adj close': 'close'})
+            # Convert to match Alpaca format (one rename, no intermediate copy)
+            columns = {col: col.lower() for col in hist.columns}
+            if 'close' not in columns.values():
+                columns.update({col: 'close' for col, lower in columns.items() if lower == 'adj close'})
+            hist = hist.rename(columns=columns)
             
             # Ensure we have required columns
-            required_cols = ['open', 'high', 'low', 'close', 'volume']
-            for col in required_cols:
-                if col not in df.columns:
-                    self.logger.warning(f"Missing column {col} in alternative data")
-                    return None
-            
-            return df
+            if not _ALT_DATA_COLUMNS.issubset(hist.columns):
+                self.logger.warning("Missing columns %s in alternative data for %s",
+                                    sorted(_ALT_DATA_COLUMNS - set(hist.columns)), yf_symbol)
+                continue
             
+            frames[yf_symbol] = hist[['open', 'high', 'low', 'close', 'volume']]
+        
+        return frames
+    
+    def _read_yf_cache(self, cache_path: str):
+        """Cached yfinance frame, or None if missing/unreadable"""
+        try:
+            return pd.read_pickle(cache_path)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            self.logger.warning(f"Alternative data fetch failed for {symbol}: {e}")
+            self.logger.warning("Ignoring unreadable yfinance cache %s: %s", cache_path, e)
             return None
     
     def update_status(self):
         """Update bot status"""
-        try:
-            self.status.active_trades = len(self.active_trades)
-            
-            # Calculate daily P&L
-            account = self.alpaca_client.get_account()
-            self.status.daily_pnl = account.portfolio_value - self.daily_stats['start_portfolio_value']
-            
-        except Exception as e:
-            self.logger.error(f"Status update error: {e}")
+        self.status.active_trades = len(self.active_trades)
+        
+        # Calculate daily P&L from the cached account; a stale cache is refreshed
+        # in the background so the loop never waits on the REST call
+        account = self._account_cache
+        if account is None:
+            try:
+                account = self._get_account_cached()
+            except Exception as e:
+                self.logger.error("Status update error: %s", e, exc_info=True)
+                return
+        elif time.monotonic() - self._account_cache_ts > self._account_ttl:
+            self._refresh_account_async()
+        
+        self.status.daily_pnl = account.portfolio_value - self.daily_stats['start_portfolio_value']
 
 def main():
     """Main entry point"""
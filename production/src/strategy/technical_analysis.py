@@ -4,6 +4,7 @@ Technical Analysis Module
 Implements RSI, MACD, volume analysis, and candlestick patterns for trading signals.
 """
 
+import asyncio
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
@@ -302,10 +303,20 @@ class TechnicalAnalyzer:
         """Scan entire universe for trading signals"""
         signals = []
         
+        # Fetch every symbol's bars concurrently when the provider supports it
+        prefetched = {}
+        if hasattr(data_provider, 'get_bars_many'):
+            try:
+                prefetched = asyncio.run(data_provider.get_bars_many(symbols, timeframe='1Day', limit=100))
+            except Exception as e:
+                self.logger.warning(f"Concurrent bar fetch failed, scanning sequentially: {e}")
+        
         for symbol in symbols:
             try:
-                # Get market data
-                df = data_provider.get_bars(symbol, timeframe='1Day', limit=100)
+                # Get market data (per-symbol fallback for anything the batch missed)
+                df = prefetched.get(symbol)
+                if df is None:
+                    df = data_provider.get_bars(symbol, timeframe='1Day', limit=100)
                 if df is not None and not df.empty:
                     signal = self.analyze_stock(symbol, df, config)
                     if signal and signal.confidence > 0.4:  # Minimum confidence threshold
@@ -10,6 +10,13 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from utils.config_rules import read_api_credentials, validate_config_dict
+
 @dataclass
 class TradingConfig:
     """Trading configuration data class"""
@@ -49,6 +56,7 @@ class ConfigManager:
             self.config_path = config_path
         
         self.config = {}
+        self.config_bytes = b''  # self.config pre-serialized as JSON, refreshed on load/save
         self.trading_config = None
         self.load_config()
     
@@ -91,6 +99,7 @@ class ConfigManager:
                 scan_universe=market['scan_universe']
             )
             
+            self._refresh_config_bytes()
             logging.info(f"Configuration loaded from {self.config_path}")
             return self.config
             
@@ -103,12 +112,20 @@ class ConfigManager:
         try:
             with open(self.config_path, 'w') as f:
                 json.dump(self.config, f, indent=2)
+            self._refresh_config_bytes()
             logging.info(f"Configuration saved to {self.config_path}")
             return True
         except Exception as e:
             logging.error(f"Failed to save config: {e}")
             return False
     
+    def _refresh_config_bytes(self):
+        """Serialize the config once so readers can serve it without re-encoding"""
+        if orjson is not None:
+            self.config_bytes = orjson.dumps(self.config)
+        else:
+            self.config_bytes = json.dumps(self.config).encode()
+    
     def update_trading_param(self, section: str, param: str, value: Any) -> bool:
         """Update a specific trading parameter"""
         try:
@@ -123,55 +140,14 @@ class ConfigManager:
     
     def get_api_credentials(self) -> Dict[str, str]:
         """Get API credentials from environment variables"""
-        credentials = {}
-        
-        # Try to load from the archived api_keys.env file
-        env_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'api_keys.env')
-        if os.path.exists(env_path):
-            with open(env_path, 'r') as f:
-                for line in f:
-                    if line.startswith('ALPACA_') and '=' in line:
-                        key, value = line.strip().split('=', 1)
-                        credentials[key] = value
-        
-        # Override with environment variables if set
-        credentials.update({
-            'ALPACA_API_KEY': os.getenv('ALPACA_API_KEY', credentials.get('ALPACA_LIVE_KEY_ID', '')),
-            'ALPACA_SECRET_KEY': os.getenv('ALPACA_SECRET_KEY', credentials.get('ALPACA_LIVE_SECRET_KEY', '')),
-            'NEWSAPI_KEY': os.getenv('NEWSAPI_KEY', credentials.get('NEWSAPI_KEY', '')),
-            'FINNHUB_API_KEY': os.getenv('FINNHUB_API_KEY', credentials.get('FINNHUB_API_KEY', ''))
-        })
-        
-        return credentials
+        return read_api_credentials()
     
     def validate_config(self) -> bool:
         """Validate configuration parameters"""
         try:
-            # Check required sections
-            required_sections = ['trading', 'market', 'apis', 'logging']
-            for section in required_sections:
-                if section not in self.config:
-                    logging.error(f"Missing required config section: {section}")
-                    return False
-            
-            # Validate trading parameters
-            tc = self.trading_config
-            if not (0 < tc.capital_use_percentage <= 100):
-                logging.error("Capital use percentage must be between 0 and 100")
-                return False
-            
-            if not (0 < tc.max_position_size <= 1):
-                logging.error("Max position size must be between 0 and 1")
-                return False
-            
-            if tc.stop_loss_percent <= 0 or tc.take_profit_percent <= 0:
-                logging.error("Stop loss and take profit must be positive")
-                return False
-            
-            # Check API credentials
-            creds = self.get_api_credentials()
-            if not creds.get('ALPACA_API_KEY') or not creds.get('ALPACA_SECRET_KEY'):
-                logging.error("Missing Alpaca API credentials")
+            error = validate_config_dict(self.config, self.get_api_credentials())
+            if error:
+                logging.error(error)
                 return False
             
             logging.info("Configuration validation successful")
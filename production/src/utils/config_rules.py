@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Configuration Rules
+Credential lookup and config validation shared by ConfigManager and the launcher.
+Standard library only, so run_bot.py can use it without loading the bot's dependencies.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+_API_KEYS_ENV_PATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'api_keys.env')
+
+def read_api_credentials(env_path: str = _API_KEYS_ENV_PATH) -> Dict[str, str]:
+    """API credentials from the environment, falling back to the archived api_keys.env file"""
+    file_credentials = {}
+    try:
+        with open(env_path, 'r') as f:
+            for line in f:
+                if line.startswith('ALPACA_') and '=' in line:
+                    key, value = line.strip().split('=', 1)
+                    file_credentials[key] = value
+    except FileNotFoundError:
+        pass
+    
+    credentials = dict(file_credentials)
+    credentials.update({
+        'ALPACA_API_KEY': os.getenv('ALPACA_API_KEY', file_credentials.get('ALPACA_LIVE_KEY_ID', '')),
+        'ALPACA_SECRET_KEY': os.getenv('ALPACA_SECRET_KEY', file_credentials.get('ALPACA_LIVE_SECRET_KEY', '')),
+        'NEWSAPI_KEY': os.getenv('NEWSAPI_KEY', file_credentials.get('NEWSAPI_KEY', '')),
+        'FINNHUB_API_KEY': os.getenv('FINNHUB_API_KEY', file_credentials.get('FINNHUB_API_KEY', ''))
+    })
+    return credentials
+
+def validate_config_dict(config: Dict[str, Any], credentials: Dict[str, str]) -> Optional[str]:
+    """Check a raw config dict and credentials; returns the first problem found, or None if valid"""
+    missing = [section for section in ('trading', 'market', 'apis', 'logging')
+               if section not in config]
+    if missing:
+        return f"Missing required config sections: {', '.join(missing)}"
+    
+    capital = config['trading']['capital_allocation']
+    risk = config['trading']['risk_management']
+    if not (0 < capital['use_percentage'] <= 100):
+        return "Capital use percentage must be between 0 and 100"
+    if not (0 < capital['max_position_size'] <= 1):
+        return "Max position size must be between 0 and 1"
+    if risk['stop_loss_percent'] <= 0 or risk['take_profit_percent'] <= 0:
+        return "Stop loss and take profit must be positive"
+    
+    if not credentials.get('ALPACA_API_KEY') or not credentials.get('ALPACA_SECRET_KEY'):
+        return "Missing Alpaca API credentials"
+    return None
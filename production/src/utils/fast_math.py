@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Fast Math Kernels
+Numba-compiled arithmetic for trade bookkeeping, with a plain-Python fallback.
+"""
+
+from typing import Tuple
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _jit(signature: str):
+    """njit(signature, cache=True) when numba is installed, otherwise a no-op decorator"""
+    if njit is None:
+        return lambda func: func
+    return njit(signature, cache=True, fastmath=True)
+
+# Side codes for compute_close_metrics
+SIDE_LONG = 1
+SIDE_SHORT = -1
+
+# Eager signature: compiled (or loaded from the on-disk cache) at import,
+# so the first trade close doesn't pay the JIT cost
+@_jit('Tuple((f8, i8))(f8, f8, i1, i8, i8)')
+def compute_close_metrics(entry_price: float, exit_price: float, side: int,
+                          entry_ts_ns: int, exit_ts_ns: int) -> Tuple[float, int]:
+    """P&L percent and holding time in whole minutes for a closed trade
+    
+    Dollar P&L is left to the broker's unrealized P&L, which reflects actual fills.
+    """
+    pnl_pct = (exit_price - entry_price) / entry_price * 100.0 * side
+    duration_min = (exit_ts_ns - entry_ts_ns) // 60_000_000_000
+    return pnl_pct, duration_min
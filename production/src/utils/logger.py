@@ -5,6 +5,7 @@ Handles trade logging, performance analysis, and strategy adaptation.
 """
 
 import csv
+import io
 import json
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
@@ -329,6 +330,34 @@ class TradingLogger:
             self.logger.error(f"Failed to load trade history: {e}")
             return pd.DataFrame()
     
+    def load_recent_trades(self, limit: int = 50) -> pd.DataFrame:
+        """Load only the last `limit` trades, reading the CSV backwards from its end"""
+        try:
+            with open(self.log_paths['trade_log'], 'rb') as f:
+                header = f.readline()
+                data_start = f.tell()
+                pos = f.seek(0, os.SEEK_END)
+                
+                # Read 64 KiB blocks from the end until there are more than `limit`
+                # line breaks, so the last `limit` lines are known to be complete
+                data = b''
+                while pos > data_start and data.count(b'\n') <= limit:
+                    size = min(65536, pos - data_start)
+                    pos -= size
+                    f.seek(pos)
+                    data = f.read(size) + data
+            
+            lines = data.splitlines()[-limit:]
+            if not lines:
+                return pd.DataFrame()
+            return pd.read_csv(io.BytesIO(header + b'\n'.join(lines) + b'\n'))
+            
+        except FileNotFoundError:
+            return pd.DataFrame()
+        except Exception as e:
+            self.logger.error(f"Failed to load recent trades: {e}")
+            return pd.DataFrame()
+    
     def load_performance_data(self):
         """Load existing performance data into memory"""
         try:
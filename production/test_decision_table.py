@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+import sys
+sys.path.append('src')
+import itertools
+
+from enhanced_bot import _DECISION_TABLE
+from strategy.technical_analysis import SignalType
+
+RECOMMENDATIONS = ('STRONG_BUY', 'BUY', 'HOLD', 'SELL', 'STRONG_SELL')
+DIRECTIONS = ('BULLISH', 'NEUTRAL', 'BEARISH')
+
+EXPECTED_ROWS = {
+    (SignalType.BUY, 'STRONG_BUY', 'BULLISH'): 'BUY',
+    (SignalType.BUY, 'STRONG_BUY', 'NEUTRAL'): 'BUY',
+    (SignalType.BUY, 'BUY', 'BULLISH'): 'BUY',
+    (SignalType.BUY, 'BUY', 'NEUTRAL'): 'BUY',
+    (SignalType.SELL, 'STRONG_SELL', 'BEARISH'): 'SELL',
+    (SignalType.SELL, 'STRONG_SELL', 'NEUTRAL'): 'SELL',
+    (SignalType.SELL, 'SELL', 'BEARISH'): 'SELL',
+    (SignalType.SELL, 'SELL', 'NEUTRAL'): 'SELL',
+}
+
+def _reference_decision(tech_signal_type, sentiment_rec, sentiment_direction):
+    """The if/elif chain the table replaced"""
+    if (tech_signal_type == SignalType.BUY and
+        sentiment_rec in ['STRONG_BUY', 'BUY'] and
+        sentiment_direction in ['BULLISH', 'NEUTRAL']):
+        return 'BUY'
+    elif (tech_signal_type == SignalType.SELL and
+          sentiment_rec in ['STRONG_SELL', 'SELL'] and
+          sentiment_direction in ['BEARISH', 'NEUTRAL']):
+        return 'SELL'
+    return None
+
+def test_decision_table_rows():
+    assert _DECISION_TABLE == EXPECTED_ROWS
+    for key, direction in EXPECTED_ROWS.items():
+        assert _DECISION_TABLE.get(key) == direction, key
+
+def test_decision_table_matches_reference():
+    for key in itertools.product(SignalType, RECOMMENDATIONS, DIRECTIONS):
+        assert _DECISION_TABLE.get(key) == _reference_decision(*key), key
+
+def test_decision_table_conflicts():
+    assert _DECISION_TABLE.get((SignalType.BUY, 'BUY', 'BEARISH')) is None
+    assert _DECISION_TABLE.get((SignalType.SELL, 'SELL', 'BULLISH')) is None
+    assert _DECISION_TABLE.get((SignalType.BUY, 'SELL', 'NEUTRAL')) is None
+    assert _DECISION_TABLE.get((SignalType.HOLD, 'STRONG_BUY', 'BULLISH')) is None
+
+if __name__ == "__main__":
+    test_decision_table_rows()
+    test_decision_table_matches_reference()
+    test_decision_table_conflicts()
+    print("✅ Decision table tests passed")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import sys
+sys.path.append('src')
+import importlib
+from unittest import mock
+
+import pytest
+
+import utils.fast_math as fast_math
+
+ENTRY_NS = 1_700_000_000 * 10**9
+EXIT_NS = ENTRY_NS + 90 * 60 * 10**9 + 30 * 10**9  # 90.5 minutes later
+
+def _check_close_metrics(compute):
+    pnl_pct, duration = compute(100.0, 110.0, fast_math.SIDE_LONG, ENTRY_NS, EXIT_NS)
+    assert pnl_pct == pytest.approx(10.0)
+    assert duration == 90
+    
+    pnl_pct, duration = compute(100.0, 110.0, fast_math.SIDE_SHORT, ENTRY_NS, EXIT_NS)
+    assert pnl_pct == pytest.approx(-10.0)
+    
+    # Holding times beyond int32 minutes still fit
+    pnl_pct, duration = compute(50.0, 50.0, fast_math.SIDE_LONG, 0, 2**31 * 60 * 10**9)
+    assert pnl_pct == 0.0
+    assert duration == 2**31
+
+def test_close_metrics_pure_python():
+    # Hide numba so the module falls back to the undecorated function
+    with mock.patch.dict(sys.modules, {'numba': None}):
+        module = importlib.reload(fast_math)
+        try:
+            assert module.njit is None
+            _check_close_metrics(module.compute_close_metrics)
+        finally:
+            importlib.reload(fast_math)
+
+def test_close_metrics_numba():
+    pytest.importorskip('numba')
+    module = importlib.reload(fast_math)
+    assert module.njit is not None
+    _check_close_metrics(module.compute_close_metrics)
+
+if __name__ == "__main__":
+    test_close_metrics_pure_python()
+    print("✅ fast_math tests passed")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import sys
+sys.path.append('src')
+import logging
+
+from api.alpaca_client import AlpacaClient
+
+def _quote(bid, ask):
+    return {'bid': bid, 'ask': ask}
+
+def _client(quotes):
+    """AlpacaClient that serves the given quotes without touching the API"""
+    client = AlpacaClient.__new__(AlpacaClient)
+    client.logger = logging.getLogger('test_position_sizes')
+    client.get_latest_quotes = lambda symbols: {s: quotes[s] for s in symbols if s in quotes}
+    client.get_latest_quote = lambda symbol: quotes.get(symbol)
+    return client
+
+def test_sizes_stay_within_risk():
+    client = _client({'AMD': _quote(99.0, 101.0), 'SOL/USD': _quote(150.0, 150.0)})
+    sizes = client.calculate_position_sizes(['AMD', 'SOL/USD'], [100.0, 50.0], [95.0, 140.0])
+    
+    # AMD: $5 risk per share -> 20 shares; SOL: $10 -> 5
+    assert sizes == {'AMD': 20, 'SOL/USD': 5}
+    assert sizes['AMD'] * 5.0 <= 100.0
+    assert sizes['SOL/USD'] * 10.0 <= 50.0
+
+def test_sizes_round_down_with_minimum_one():
+    client = _client({'AMD': _quote(100.0, 100.0)})
+    # $7 budget at $3 risk per share rounds down to 2
+    assert client.calculate_position_sizes(['AMD'], [7.0], [97.0]) == {'AMD': 2}
+    # A budget smaller than one share's risk still sizes one share
+    assert client.calculate_position_sizes(['AMD'], [1.0], [90.0]) == {'AMD': 1}
+
+def test_sizes_without_risk_or_quote():
+    client = _client({'AMD': _quote(100.0, 100.0)})
+    sizes = client.calculate_position_sizes(['AMD', 'MISSING'], [100.0, 100.0], [100.0, 95.0])
+    assert sizes == {'AMD': 0, 'MISSING': 0}
+
+def test_sizes_zero_or_negative_price():
+    client = _client({'ZERO': _quote(0.0, 0.0), 'NEG': _quote(-2.0, -1.0)})
+    sizes = client.calculate_position_sizes(['ZERO', 'NEG'], [100.0, 100.0], [5.0, 5.0])
+    assert sizes == {'ZERO': 0, 'NEG': 0}
+
+def test_sizes_match_scalar():
+    quotes = {'AMD': _quote(99.0, 101.0), 'SOL/USD': _quote(150.0, 152.0),
+              'FLAT': _quote(10.0, 10.0), 'ZERO': _quote(0.0, 0.0)}
+    symbols = ['AMD', 'SOL/USD', 'FLAT', 'ZERO', 'MISSING']
+    risk_amounts = [250.0, 40.0, 10.0, 10.0, 10.0]
+    stop_prices = [93.5, 160.0, 10.0, 1.0, 1.0]
+    client = _client(quotes)
+    
+    sizes = client.calculate_position_sizes(symbols, risk_amounts, stop_prices)
+    for symbol, risk_amount, stop_price in zip(symbols, risk_amounts, stop_prices):
+        assert sizes[symbol] == client.calculate_position_size(symbol, risk_amount, stop_price), symbol
+
+if __name__ == "__main__":
+    test_sizes_stay_within_risk()
+    test_sizes_round_down_with_minimum_one()
+    test_sizes_without_risk_or_quote()
+    test_sizes_zero_or_negative_price()
+    test_sizes_match_scalar()
+    print("✅ calculate_position_sizes tests passed")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import sys
+sys.path.append('src')
+from unittest import mock
+
+import orjson
+from alpaca.trading.client import TradingClient
+from api.alpaca_client import AlpacaClient
+
+def _client_with_session(status_code=200):
+    """AlpacaClient around a real TradingClient whose HTTP session is mocked"""
+    trading_client = TradingClient('key-id', 'secret', paper=True)
+    response = mock.Mock(status_code=status_code, content=b'{"id": "order-123"}', text='rejected')
+    trading_client._session = mock.Mock()
+    trading_client._session.post.return_value = response
+    
+    client = AlpacaClient.__new__(AlpacaClient)
+    client.trading_client = trading_client
+    return client, trading_client._session
+
+def test_submit_market_raw_request():
+    client, session = _client_with_session()
+    
+    order_id = client._submit_market_raw('AAPL', 1.5, 'buy', 'day')
+    
+    assert order_id == 'order-123'
+    session.post.assert_called_once()
+    args, kwargs = session.post.call_args
+    assert args[0] == 'https://paper-api.alpaca.markets/v2/orders'
+    
+    headers = kwargs['headers']
+    assert headers['APCA-API-KEY-ID'] == 'key-id'
+    assert headers['APCA-API-SECRET-KEY'] == 'secret'
+    assert headers['Content-Type'] == 'application/json'
+    
+    assert orjson.loads(kwargs['data']) == {
+        'symbol': 'AAPL',
+        'qty': '1.5',
+        'side': 'buy',
+        'type': 'market',
+        'time_in_force': 'day'
+    }
+    assert kwargs['allow_redirects'] is False
+
+def test_submit_market_raw_rejected():
+    client, _ = _client_with_session(status_code=403)
+    try:
+        client._submit_market_raw('AAPL', 1, 'buy', 'day')
+    except RuntimeError as e:
+        assert 'HTTP 403' in str(e)
+    else:
+        raise AssertionError("expected a rejected order to raise")
+
+def test_submit_market_raw_missing_internals():
+    client = AlpacaClient.__new__(AlpacaClient)
+    client.trading_client = mock.Mock(spec=['submit_order'])
+    assert client._submit_market_raw('AAPL', 1, 'buy', 'day') is None
+
+if __name__ == "__main__":
+    test_submit_market_raw_request()
+    test_submit_market_raw_rejected()
+    test_submit_market_raw_missing_internals()
+    print("✅ _submit_market_raw tests passed")
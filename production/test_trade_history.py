@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import sys
+sys.path.append('src')
+
+import pytest
+
+from enhanced_bot import TradeHistory
+
+def test_empty_history():
+    history = TradeHistory()
+    assert len(history) == 0
+    assert history.total_pnl() == 0.0
+    assert history.win_rate() == 0.0
+
+def test_append_and_stats():
+    history = TradeHistory()
+    history.append('AMD', 12.5, 2.5, 30, 'Take profit hit')
+    history.append('SOL/USD', -4.0, -1.0, 95, 'Stop loss hit')
+    history.append('AMD', 0.0, 0.0, 5, 'Max hold time')
+    
+    assert len(history) == 3
+    assert history.symbol == ['AMD', 'SOL/USD', 'AMD']
+    assert history.exit_reason[1] == 'Stop loss hit'
+    assert history.duration[:3].tolist() == [30, 95, 5]
+    assert history.total_pnl() == pytest.approx(8.5)
+    # Break-even trades are not wins
+    assert history.win_rate() == pytest.approx(1 / 3)
+
+def test_append_grows_capacity():
+    history = TradeHistory(capacity=2)
+    for i in range(5):
+        history.append('AMD', float(i), float(i), i, 'test')
+    
+    assert len(history) == 5
+    assert len(history.pnl) >= 5
+    assert history.pnl[:5].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert history.total_pnl() == pytest.approx(10.0)
+    assert history.win_rate() == pytest.approx(0.8)
+
+if __name__ == "__main__":
+    test_empty_history()
+    test_append_and_stats()
+    test_append_grows_capacity()
+    print("✅ TradeHistory tests passed")